@@ -1,28 +1,45 @@
 ﻿from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+import heapq
+from operator import itemgetter
+import sys
 import threading
-from typing import Any, Coroutine
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Coroutine
 from uuid import uuid4
 
 from app.container_runner import ContainerExecutionConfig, DockerSandboxRunner
 from app.config import AgentConfig, get_trust_path, save_config
 from app.coordinator_client import CoordinatorClient
-from app.device_probe import collect_device_snapshot, format_debug_trace, format_snapshot
+from app.device_probe import collect_device_snapshot
 from app.gpu_detector import detect_gpu, get_system_ram_gb, get_vram_used_gb
 from app.heartbeat import heartbeat_loop
 from app.job_worker import job_worker_loop
+from app.models import detect_task_mode, preview
 from app.state import AgentState
 from app.trust_manager import TrustManager
 
 DEFAULT_FABRIC_MODEL = "fabric-workload-v1"
+NOW_CACHE_NS = 50_000_000
+TASK_SNAPSHOT_LIMIT = 80
+
+_datetime_now = datetime.now
+_updated_at_key = itemgetter("updated_at")
+_ACTIVE_TASK_STATUSES = frozenset({"pending", "running", "verifying"})
+_TASK_COUNT_KEYS = ("total", "pending", "running", "verifying", "completed", "failed", "assigned_to_node")
 
 
 class AgentController:
     STATUS_POLL_SEC = 4
+    # How long shutdown waits for the services_offline heartbeat before closing the client.
+    OFFLINE_PRESENCE_WAIT_SEC = 1.0
     AUTO_REGISTER_BACKOFF_SEC = 10
     TASK_SNAPSHOT_SEC = 5
+    VRAM_CACHE_SEC = 2
 
     def __init__(self, config: AgentConfig, state: AgentState, event_queue, logger) -> None:
         self._config = config
@@ -32,7 +49,11 @@ class AgentController:
 
         self._thread: threading.Thread | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None
         self._stop_event: asyncio.Event | None = None
+        self._state_dirty: asyncio.Event | None = None
+        self._shutdown_complete: asyncio.Event | None = None
+        self._executor: ThreadPoolExecutor | None = None
 
         self._client: CoordinatorClient | None = None
         self._trust: TrustManager | None = None
@@ -41,15 +62,44 @@ class AgentController:
         self._status_task: asyncio.Task | None = None
         self._heartbeat_task: asyncio.Task | None = None
         self._job_task: asyncio.Task | None = None
+        self._health_inflight: asyncio.Future | None = None
+        self._tasks_inflight: asyncio.Future | None = None
+        self._presence_inflight: tuple[tuple, asyncio.Future] | None = None
+        self._pending_submissions: set = set()
+        self._offline_presence: Future | asyncio.Task | None = None
+        self._last_presence: tuple[tuple, float] | None = None
 
         self._services_running = False
         self._runtime_enabled = False
-        self._last_auto_register_attempt: datetime | None = None
+        self._register_backoff_until = 0.0  # time.monotonic()
         self._last_task_snapshot_at: datetime | None = None
+        self._now_cached: datetime | None = None
+        self._now_bucket = -1
+        self._vram_used_gb = 0.0
+        self._vram_probed_at: float | None = None
+        self._endpoints: SimpleNamespace | None = None
+        self._last_status_key: tuple | None = None
+
+        # Set once the agent loop has initialized / fully shut down, for callers that need to sequence on it.
+        self.services_ready = threading.Event()
+        self.runtime_stopped = threading.Event()
+        self.runtime_stopped.set()
+
+    def _now(self) -> datetime:
+        # Transitions within one tick share a timestamp; 50ms is well below anything the UI shows.
+        bucket = time.monotonic_ns() // NOW_CACHE_NS
+        if bucket != self._now_bucket:
+            self._now_cached = _datetime_now()
+            self._now_bucket = bucket
+        return self._now_cached
 
     def is_running(self) -> bool:
         return self._thread is not None and self._thread.is_alive()
 
+    @property
+    def services_started(self) -> bool:
+        return self._services_running
+
     def start_services(self) -> None:
         if self._services_running:
             self.emit("console", {"message": "services_already_running"})
@@ -57,10 +107,13 @@ class AgentController:
 
         self._services_running = True
         self._state.node_agent_status = "starting"
-        self._state.services_started_at = datetime.now()
+        self._state.services_started_at = self._now()
         self._state.touch()
+        self._mark_dirty()
 
         if not self.is_running():
+            self.services_ready.clear()
+            self.runtime_stopped.clear()
             self._thread = threading.Thread(target=self._run_thread, daemon=True)
             self._thread.start()
 
@@ -78,19 +131,18 @@ class AgentController:
 
         if self._state.registered and self._state.node_id:
             # Push offline immediately so web UI reflects service stop without waiting for timeout.
-            self._submit_async(self._send_presence_heartbeat(status="offline", jobs_running=0, event_name="services_offline"))
+            self._offline_presence = self._submit_async(
+                self._send_presence_heartbeat(status="offline", jobs_running=0, event_name="services_offline")
+            )
 
         self._services_running = False
         self._runtime_enabled = False
 
         if self._loop and self._stop_event:
-            self._loop.call_soon_threadsafe(self._stop_event.set)
+            self._call_in_loop(self._stop_event.set)
+        self._mark_dirty()
 
-        thread_alive = False
-        if self._thread:
-            self._thread.join(timeout=1.5)
-            thread_alive = self._thread.is_alive()
-        if not thread_alive:
+        if self._thread is None or self._wait_for_run_exit(timeout=1.5):
             self._thread = None
             self._loop = None
             self._stop_event = None
@@ -131,6 +183,7 @@ class AgentController:
             return
 
         self._runtime_enabled = True
+        self._mark_dirty()
         if not self._state.registered or not self._state.node_id:
             self.emit("console", {"message": "runtime_start_info: auto_registration_pending"})
             self._state.runtime_status = "awaiting-registration"
@@ -141,7 +194,7 @@ class AgentController:
             return
 
         self._state.runtime_status = "starting"
-        self._state.runtime_started_at = datetime.now()
+        self._state.runtime_started_at = self._now()
         self._state.touch()
         # Ensure claim loop can run immediately (offline nodes cannot claim jobs).
         self._submit_async(self._send_presence_heartbeat(status="healthy", jobs_running=0, event_name="runtime_starting"))
@@ -154,6 +207,7 @@ class AgentController:
             return
 
         self._runtime_enabled = False
+        self._mark_dirty()
         self._state.runtime_status = "stopping"
         self._state.runtime_started_at = None
         self._state.current_job_status = "idle"
@@ -161,7 +215,7 @@ class AgentController:
         self._state.touch()
 
         if self._loop:
-            self._loop.call_soon_threadsafe(self._cancel_job_task)
+            self._call_in_loop(self._cancel_job_task)
         if self._services_running and self._state.registered and self._state.node_id:
             self._submit_async(self._send_presence_heartbeat(status="healthy", jobs_running=0, event_name="runtime_stopped"))
 
@@ -221,30 +275,116 @@ class AgentController:
         self.emit("console", {"message": f"demo_mode={'on' if enabled else 'off'}"})
 
     def emit(self, event_type: str, payload: dict[str, Any] | None = None) -> None:
-        self._queue.put({"type": event_type, "payload": payload or {}})
+        self._queue.put({"type": sys.intern(event_type), "payload": payload or {}})
 
     def _emit_status(self) -> None:
+        state = self._state
+        key = (
+            state.coordinator_status,
+            state.node_agent_status,
+            state.discovery_status,
+            state.registration_status,
+            state.runtime_status,
+            state.node_id,
+            state.trust_score,
+        )
+        # Transitions and the status loop re-emit freely; only publish snapshots that changed.
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
         self.emit(
             "status",
             {
-                "coordinator": self._state.coordinator_status,
-                "agent": self._state.node_agent_status,
-                "discovery": self._state.discovery_status,
-                "registration": self._state.registration_status,
-                "runtime": self._state.runtime_status,
-                "node_id": self._state.node_id,
-                "trust": self._state.trust_score,
+                "coordinator": key[0],
+                "agent": key[1],
+                "discovery": key[2],
+                "registration": key[3],
+                "runtime": key[4],
+                "node_id": key[5],
+                "trust": key[6],
             },
         )
 
+    def _new_event_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop_factory is None:
+            self._loop_factory = asyncio.new_event_loop
+            if self._config.use_uvloop:
+                try:
+                    import uvloop
+                except Exception as exc:
+                    self._logger.info("uvloop_not_available", extra={"error": str(exc)})
+                else:
+                    self._loop_factory = uvloop.new_event_loop
+        return self._loop_factory()
+
+    def _run_on_new_loop(self, coro: Coroutine[Any, Any, Any]) -> None:
+        loop = self._new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(coro)
+        finally:
+            # Same teardown as asyncio.run: leftover tasks (e.g. a presence heartbeat submitted
+            # during stop) are cancelled and awaited rather than destroyed while pending.
+            try:
+                self._cancel_leftover_tasks(loop)
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+            finally:
+                asyncio.set_event_loop(None)
+                loop.close()
+
+    def _cancel_leftover_tasks(self, loop: asyncio.AbstractEventLoop) -> None:
+        tasks = asyncio.all_tasks(loop)
+        if not tasks:
+            return
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        for task in tasks:
+            if task.cancelled():
+                continue
+            exc = task.exception()
+            if exc is not None:
+                self._logger.warning("leftover_task_failed", extra={"error": str(exc)})
+
+    def _wait_for_run_exit(self, timeout: float) -> bool:
+        # Return as soon as _run has shut down rather than after the thread finishes tearing down its loop.
+        loop, done = self._loop, self._shutdown_complete
+        if loop is None or done is None:
+            self._thread.join(timeout=timeout)
+            return not self._thread.is_alive()
+        if done.is_set():
+            return True
+        try:
+            asyncio.run_coroutine_threadsafe(done.wait(), loop).result(timeout=timeout)
+        except (FutureTimeoutError, RuntimeError):
+            # RuntimeError: the loop closed in between, so the run is already over.
+            pass
+        return done.is_set() or not self._thread.is_alive()
+
     def _run_thread(self) -> None:
-        asyncio.run(self._run())
+        try:
+            self._run_on_new_loop(self._run())
+        finally:
+            # A restart may already own the controller; don't clobber its readiness flags.
+            if self._thread in (None, threading.current_thread()):
+                self.services_ready.clear()
+                self.runtime_stopped.set()
 
     async def _run(self) -> None:
         self._loop = asyncio.get_running_loop()
         self._stop_event = asyncio.Event()
+        self._state_dirty = asyncio.Event()
+        self._shutdown_complete = asyncio.Event()
+        # Only a couple of blocking calls go through the executor; the default pool sizes for cpu_count()+4.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._config.agent_executor_workers or 2,
+            thread_name_prefix="hyperlooms-agent",
+        )
+        self._loop.set_default_executor(self._executor)
 
         await self._initialize()
+        self.services_ready.set()
 
         self._status_task = asyncio.create_task(self._status_loop())
 
@@ -252,7 +392,7 @@ class AgentController:
             if not self._services_running:
                 await self._stop_runtime_tasks()
                 self._set_runtime_state("stopped")
-                await asyncio.sleep(0.5)
+                await self._wait_for_state_change()
                 continue
 
             if not self._state.registered:
@@ -277,17 +417,37 @@ class AgentController:
                 await self._stop_job_task()
                 self._set_runtime_state("stopped")
 
-            await asyncio.sleep(0.5)
+            await self._wait_for_state_change()
 
         await self._stop_runtime_tasks()
-        if self._status_task:
-            self._status_task.cancel()
-            await asyncio.gather(self._status_task, return_exceptions=True)
+        await self._cancel_and_wait(self._status_task)
 
         await self._shutdown()
+        self._shutdown_complete.set()
+
+    async def _wait_for_state_change(self) -> None:
+        # The timeout keeps the loop self-healing for flags flipped outside the controller (heartbeat/job loops).
+        timeout = self.STATUS_POLL_SEC
+        if self._services_running and not self._state.registered:
+            # Wake exactly when the next auto-register attempt is allowed.
+            timeout = min(timeout, max(0.0, self._register_backoff_until - time.monotonic()))
+        try:
+            await asyncio.wait_for(self._state_dirty.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._state_dirty.clear()
+
+    def _mark_dirty(self) -> None:
+        if self._loop is None or self._state_dirty is None:
+            return
+        try:
+            self._call_in_loop(self._state_dirty.set)
+        except RuntimeError:
+            # Loop already closed; nothing left to wake.
+            pass
 
     async def _initialize(self) -> None:
-        gpu = detect_gpu(self._logger)
+        gpu = await asyncio.to_thread(detect_gpu, self._logger)
         self._state.ram_total_gb = get_system_ram_gb()
         if gpu:
             self._state.gpu_name = gpu.name
@@ -300,7 +460,7 @@ class AgentController:
         self._state.node_id = self._config.node_id or ""
         self._state.registered = bool(self._state.node_id)
         self._state.registration_status = "registered" if self._state.registered else "not-registered"
-        self._state.model_cache = list(self._config.model_cache)
+        self._state.set_model_cache(list(self._config.model_cache))
         self._state.touch()
 
         self._trust = TrustManager(get_trust_path())
@@ -337,6 +497,7 @@ class AgentController:
             self._state.node_agent_status = "ok"
             self._state.registration_status = "registered" if self._state.registered else "not-registered"
             self._state.touch()
+            self._mark_dirty()
             self._emit_status()
             await self._emit_distributed_tasks(force=False)
 
@@ -357,6 +518,22 @@ class AgentController:
         )
 
     async def _check_coordinator_once(self) -> bool:
+        # Status loop, refreshes and registration often probe together; share one in-flight request.
+        if not self._in_loop_thread():
+            return await self._probe_coordinator()
+        if self._health_inflight is not None:
+            return await asyncio.shield(self._health_inflight)
+
+        inflight = self._health_inflight = self._loop.create_future()
+        ok = False
+        try:
+            ok = await self._probe_coordinator()
+        finally:
+            self._health_inflight = None
+            inflight.set_result(ok)
+        return ok
+
+    async def _probe_coordinator(self) -> bool:
         client = self._client
         temp_client: CoordinatorClient | None = None
 
@@ -391,27 +568,14 @@ class AgentController:
 
     def _detect_task_mode_from_payload(self, payload: dict[str, Any]) -> str:
         config = payload.get("config")
-        if isinstance(config, dict):
-            mode = str(config.get("mode") or "").strip().lower()
-            if mode in {"train", "finetune", "inference", "evaluation"}:
-                return mode
-
-        prompt = str(payload.get("prompt") or "")
-        lowered = prompt.lower()
-        marker = "workload_mode:"
-        if marker in lowered:
-            tail = lowered.split(marker, 1)[1].strip()
-            candidate = tail.splitlines()[0].strip().split(" ", 1)[0]
-            if candidate in {"train", "finetune", "inference", "evaluation"}:
-                return candidate
-
-        return "inference"
+        configured_mode = config.get("mode") if isinstance(config, dict) else None
+        return detect_task_mode(configured_mode, str(payload.get("prompt") or ""))
 
     async def _emit_distributed_tasks(self, force: bool) -> None:
         if not self._services_running or not self._client or not self._state.connected:
             return
 
-        now = datetime.now()
+        now = self._now()
         if (
             not force
             and self._last_task_snapshot_at is not None
@@ -420,6 +584,22 @@ class AgentController:
             return
         self._last_task_snapshot_at = now
 
+        # Concurrent refreshes (UI spam, status loop, registration) share one fetch.
+        if not self._in_loop_thread():
+            await self._fetch_distributed_tasks(now)
+            return
+        if self._tasks_inflight is not None:
+            await asyncio.shield(self._tasks_inflight)
+            return
+
+        inflight = self._tasks_inflight = self._loop.create_future()
+        try:
+            await self._fetch_distributed_tasks(now)
+        finally:
+            self._tasks_inflight = None
+            inflight.set_result(None)
+
+    async def _fetch_distributed_tasks(self, now: datetime) -> None:
         try:
             jobs = await self._client.list_jobs(self._config.job_submit_endpoint)
         except Exception as exc:  # noqa: BLE001
@@ -427,31 +607,33 @@ class AgentController:
             return
 
         node_id = (self._state.node_id or "").strip()
-        counts = {
-            "total": 0,
-            "pending": 0,
-            "running": 0,
-            "verifying": 0,
-            "completed": 0,
-            "failed": 0,
-            "assigned_to_node": 0,
-        }
+        counts = dict.fromkeys(_TASK_COUNT_KEYS, 0)
+        total = 0
+        assigned_to_node = 0
         items: list[dict[str, Any]] = []
 
+        # Locals for the per-job loop; job lists can run to thousands of entries.
+        _str = str
+        append = items.append
+        detect_mode = self._detect_task_mode_from_payload
         for raw in jobs:
-            job_id = str(raw.get("id") or "").strip()
+            get = raw.get
+            job_id = _str(get("id") or "").strip()
             if not job_id:
                 continue
 
-            status = str(raw.get("status") or "unknown").strip().lower()
-            counts["total"] += 1
-            if status in counts:
+            status = _str(get("status") or "unknown").strip().lower()
+            total += 1
+            try:
                 counts[status] += 1
-
-            assigned = [str(x) for x in (raw.get("assigned_node_ids") or [])]
-            inflight = [str(x) for x in (raw.get("inflight_node_ids") or [])]
-            scheduled = [str(x) for x in (raw.get("scheduled_node_ids") or [])]
-            failed_ids = [str(x) for x in (raw.get("failed_node_ids") or [])]
+            except KeyError:
+                pass
+
+            # dict.fromkeys dedupes in the coordinator's order; the UI lists these ids as given.
+            assigned = dict.fromkeys(_str(x) for x in (get("assigned_node_ids") or ()))
+            inflight = dict.fromkeys(_str(x) for x in (get("inflight_node_ids") or ()))
+            scheduled = {_str(x) for x in (get("scheduled_node_ids") or ())}
+            failed_ids = {_str(x) for x in (get("failed_node_ids") or ())}
             node_related = bool(node_id) and (
                 node_id in assigned
                 or node_id in inflight
@@ -459,41 +641,46 @@ class AgentController:
                 or node_id in failed_ids
             )
             if node_related:
-                counts["assigned_to_node"] += 1
+                assigned_to_node += 1
 
             # Keep the node view focused on active network jobs and jobs related to this node.
-            if not node_related and status not in {"pending", "running", "verifying"}:
+            if not node_related and status not in _ACTIVE_TASK_STATUSES:
                 continue
 
-            prompt = str(raw.get("prompt") or "")
-            merged_output = str(raw.get("merged_output") or "")
+            prompt = _str(get("prompt") or "")
+            merged_output = _str(get("merged_output") or "")
             try:
-                progress = float(raw.get("progress") or 0.0)
+                progress = float(get("progress") or 0.0)
             except (TypeError, ValueError):
                 progress = 0.0
 
-            items.append(
+            append(
                 {
                     "job_id": job_id,
                     "status": status,
                     "scope": ("assigned" if node_related else "network"),
-                    "mode": self._detect_task_mode_from_payload(raw),
+                    "mode": detect_mode(raw),
                     "progress": max(0.0, min(100.0, progress)),
-                    "prompt_preview": prompt.strip().replace("\n", " ")[:240],
-                    "result_preview": merged_output.strip().replace("\n", " ")[:240],
-                    "updated_at": str(raw.get("updated_at") or ""),
-                    "assigned_node_ids": assigned,
-                    "inflight_node_ids": inflight,
+                    # Slice before translating so only the preview is copied.
+                    "prompt_preview": preview(prompt),
+                    "result_preview": preview(merged_output),
+                    "updated_at": _str(get("updated_at") or ""),
+                    "assigned_node_ids": list(assigned),
+                    "inflight_node_ids": list(inflight),
                 }
             )
 
-        items.sort(key=lambda item: str(item.get("updated_at") or ""), reverse=True)
+        counts["total"] += total
+        counts["assigned_to_node"] += assigned_to_node
+
+        # updated_at is already a str on every item; nlargest skips the full sort on long job lists.
+        items = heapq.nlargest(TASK_SNAPSHOT_LIMIT, items, key=_updated_at_key)
         self.emit(
             "distributed_tasks",
             {
                 "node_id": node_id,
                 "counts": counts,
-                "items": items[:80],
+                "items": items,
                 "updated_at": now.isoformat(),
             },
         )
@@ -503,16 +690,42 @@ class AgentController:
             return
         self._state.runtime_status = value
         if value == "running" and self._state.runtime_started_at is None:
-            self._state.runtime_started_at = datetime.now()
+            self._state.runtime_started_at = self._now()
         if value != "running":
             self._state.runtime_started_at = None
         self._state.touch()
+        self._mark_dirty()
         self._emit_status()
 
     async def _send_presence_heartbeat(self, status: str, jobs_running: int, event_name: str) -> bool:
         if not self._state.node_id:
             return False
 
+        # Service/runtime toggles often repeat the presence the coordinator already has; skip those
+        # while the last report is fresher than one heartbeat interval, and share identical in-flight reports.
+        key = (self._state.node_id, status, max(0, jobs_running))
+        last = self._last_presence
+        if last is not None and last[0] == key and time.monotonic() - last[1] < self._config.heartbeat_interval_sec:
+            return True
+        if not self._in_loop_thread():
+            return await self._post_presence_heartbeat(key, event_name)
+
+        inflight = self._presence_inflight
+        if inflight is not None and inflight[0] == key:
+            return await asyncio.shield(inflight[1])
+        future = self._loop.create_future()
+        self._presence_inflight = (key, future)
+        ok = False
+        try:
+            ok = await self._post_presence_heartbeat(key, event_name)
+        finally:
+            if self._presence_inflight is not None and self._presence_inflight[1] is future:
+                self._presence_inflight = None
+            future.set_result(ok)
+        return ok
+
+    async def _post_presence_heartbeat(self, key: tuple, event_name: str) -> bool:
+        _, status, jobs_running = key
         client = self._client
         temp_client: CoordinatorClient | None = None
         if client is None:
@@ -521,13 +734,15 @@ class AgentController:
 
         payload = {
             "status": status,
-            "vram_used_gb": get_vram_used_gb(self._logger),
+            "vram_used_gb": await self._get_vram_used_gb(),
             "latency_ms": None,
-            "jobs_running": max(0, jobs_running),
+            "jobs_running": jobs_running,
             "model_cache": self._state.model_cache,
         }
-        endpoint = self._config.heartbeat_endpoint.format(node_id=self._state.node_id)
+        endpoint = self._node_endpoints().heartbeat
 
+        # Any failure below must let the next report through.
+        self._last_presence = None
         try:
             response = await client.heartbeat(endpoint, payload)
             if response is None:
@@ -536,13 +751,16 @@ class AgentController:
                 self._state.last_error = "presence_heartbeat_failed: node_not_registered_remote"
                 self._state.last_event = "presence_heartbeat_node_not_registered"
                 self._state.touch()
+                self._mark_dirty()
                 self._emit_status()
                 return False
-            self._state.last_heartbeat = datetime.now()
+            self._state.last_heartbeat = self._now()
             self._state.last_event = event_name
             self._state.connected = status != "offline"
             self._state.touch()
+            self._mark_dirty()
             self._emit_status()
+            self._last_presence = (key, time.monotonic())
             return True
         except Exception as exc:  # noqa: BLE001
             self._state.connected = False
@@ -552,26 +770,56 @@ class AgentController:
                 extra={"status": status, "jobs_running": jobs_running, "error": str(exc)},
             )
             self._state.touch()
+            self._mark_dirty()
             self._emit_status()
             return False
         finally:
             if temp_client:
                 await temp_client.close()
 
+    async def _get_vram_used_gb(self) -> float:
+        # The probe may shell out to nvidia-smi; keep it off the loop and reuse it across transition bursts.
+        now = time.monotonic()
+        if self._vram_probed_at is None or now - self._vram_probed_at >= self.VRAM_CACHE_SEC:
+            self._vram_used_gb = await asyncio.to_thread(get_vram_used_gb, self._logger)
+            self._vram_probed_at = time.monotonic()
+        return self._vram_used_gb
+
+    def _node_endpoints(self) -> SimpleNamespace:
+        # Formatted once per node id and template set; result/fail keep {job_id} for
+        # job_worker_loop to fill in. The config is edited in place, so the templates are part
+        # of the key rather than relying on an explicit invalidation.
+        cfg = self._config
+        key = (
+            self._state.node_id,
+            cfg.heartbeat_endpoint,
+            cfg.job_claim_endpoint,
+            cfg.job_result_endpoint,
+            cfg.job_fail_endpoint,
+        )
+        if self._endpoints is None or self._endpoints.key != key:
+            node_id, heartbeat, claim, result, fail = key
+            self._endpoints = SimpleNamespace(
+                key=key,
+                heartbeat=heartbeat.format(node_id=node_id),
+                claim=claim.format(node_id=node_id),
+                result_tmpl=result.format(node_id=node_id, job_id="{job_id}"),
+                fail_tmpl=fail.format(node_id=node_id, job_id="{job_id}"),
+            )
+        return self._endpoints
+
     async def _ensure_heartbeat_task(self) -> None:
         if not self._client or not self._trust:
             return
         if not self._state.node_id:
             return
 
-        heartbeat_endpoint = self._config.heartbeat_endpoint.format(node_id=self._state.node_id)
-
         if not self._heartbeat_task or self._heartbeat_task.done():
             self._heartbeat_task = asyncio.create_task(
                 heartbeat_loop(
                     self._state,
                     self._client,
-                    heartbeat_endpoint,
+                    self._node_endpoints().heartbeat,
                     self._config.heartbeat_interval_sec,
                     self._stop_event,
                     self._logger,
@@ -584,22 +832,18 @@ class AgentController:
         if not self._state.node_id:
             return
 
-        heartbeat_endpoint = self._config.heartbeat_endpoint.format(node_id=self._state.node_id)
-        claim_endpoint = self._config.job_claim_endpoint.format(node_id=self._state.node_id)
-        result_endpoint = self._config.job_result_endpoint.format(node_id=self._state.node_id, job_id="{job_id}")
-        fail_endpoint = self._config.job_fail_endpoint.format(node_id=self._state.node_id, job_id="{job_id}")
-
         if not self._job_task or self._job_task.done():
+            endpoints = self._node_endpoints()
             self._job_task = asyncio.create_task(
                 job_worker_loop(
                     self._state,
                     self._client,
                     None,
                     self._trust,
-                    heartbeat_endpoint,
-                    claim_endpoint,
-                    result_endpoint,
-                    fail_endpoint,
+                    endpoints.heartbeat,
+                    endpoints.claim,
+                    endpoints.result_tmpl,
+                    endpoints.fail_tmpl,
                     self._config.job_poll_interval_sec,
                     self._stop_event,
                     self._logger,
@@ -617,40 +861,42 @@ class AgentController:
         if self._job_task:
             self._job_task.cancel()
 
+    async def _cancel_and_wait(self, task: asyncio.Task | None) -> None:
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            # Only the cancellation requested above is expected. A cancel aimed at the caller while
+            # it waited (asyncio forwards it to the awaited task too) must propagate.
+            cancelling = getattr(asyncio.current_task(), "cancelling", None)  # Python 3.11+
+            if not task.cancelled() or (cancelling is not None and cancelling()):
+                raise
+        except Exception:  # noqa: BLE001
+            pass
+
     async def _stop_heartbeat_task(self) -> None:
-        tasks = [task for task in (self._heartbeat_task,) if task]
-        for task in tasks:
-            task.cancel()
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        await self._cancel_and_wait(self._heartbeat_task)
         self._heartbeat_task = None
 
     async def _stop_job_task(self) -> None:
-        tasks = [task for task in (self._job_task,) if task]
-        for task in tasks:
-            task.cancel()
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        await self._cancel_and_wait(self._job_task)
         self._job_task = None
 
     async def _stop_runtime_tasks(self) -> None:
-        tasks = [task for task in (self._heartbeat_task, self._job_task) if task]
-        for task in tasks:
-            task.cancel()
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-        self._heartbeat_task = None
-        self._job_task = None
+        await self._stop_heartbeat_task()
+        await self._stop_job_task()
 
     async def _attempt_auto_register(self) -> None:
-        now = datetime.now()
-        if self._last_auto_register_attempt and now - self._last_auto_register_attempt < timedelta(seconds=self.AUTO_REGISTER_BACKOFF_SEC):
+        now = time.monotonic()
+        if now < self._register_backoff_until:
             return
-        self._last_auto_register_attempt = now
+        self._register_backoff_until = now + self.AUTO_REGISTER_BACKOFF_SEC
         await self._register_node(auto=True)
 
     async def _run_discovery(self, initial: bool = False) -> None:
-        snapshot, debug = collect_device_snapshot(self._state.node_id)
+        snapshot, debug = await asyncio.to_thread(collect_device_snapshot, self._state.node_id)
         self._apply_snapshot(snapshot)
 
         eligible, reason = self._evaluate_eligibility(snapshot)
@@ -665,20 +911,15 @@ class AgentController:
         self._state.eligibility_reason = reason
         self._state.touch()
 
-        self.emit(
-            "device_details",
-            {
-                "snapshot": format_snapshot(snapshot),
-                "debug": format_debug_trace(debug),
-            },
-        )
+        # Consumers format on render (see device_probe.format_snapshot); the headless runner never does.
+        self.emit("device_details", {"snapshot": snapshot, "debug": debug})
 
         if not initial:
             self.emit("console", {"message": f"discovery_done eligible={eligible} reason={reason}"})
         self._emit_status()
 
     async def _fetch_device_details(self) -> None:
-        snapshot, debug = collect_device_snapshot(self._state.node_id)
+        snapshot, debug = await asyncio.to_thread(collect_device_snapshot, self._state.node_id)
         self._apply_snapshot(snapshot)
         eligible, reason = self._evaluate_eligibility(snapshot)
         snapshot["eligible"] = eligible
@@ -692,28 +933,32 @@ class AgentController:
         self._state.eligibility_reason = reason
         self._state.touch()
 
-        self.emit(
-            "device_details",
-            {
-                "snapshot": format_snapshot(snapshot),
-                "debug": format_debug_trace(debug),
-            },
-        )
+        # Consumers format on render (see device_probe.format_snapshot); the headless runner never does.
+        self.emit("device_details", {"snapshot": snapshot, "debug": debug})
         self.emit("console", {"message": "device_details_fetched"})
         self._emit_status()
 
     def _apply_snapshot(self, snapshot: dict[str, Any]) -> None:
-        self._state.cpu_model = str(snapshot.get("cpu_model", "Unknown"))
-        self._state.cpu_physical = int(snapshot.get("cpu_physical", 0) or 0)
-        self._state.cpu_logical = int(snapshot.get("cpu_logical", 0) or 0)
-        self._state.ram_total_gb = float(snapshot.get("ram_total_gb", 0.0) or 0.0)
-        self._state.ram_free_gb = float(snapshot.get("ram_free_gb", 0.0) or 0.0)
-        self._state.disk_total_gb = float(snapshot.get("disk_total_gb", 0.0) or 0.0)
-        self._state.disk_free_gb = float(snapshot.get("disk_free_gb", 0.0) or 0.0)
-        self._state.gpu_name = str(snapshot.get("gpu_model", "Unknown"))
-        self._state.vram_total_gb = float(snapshot.get("vram_total_gb", 0.0) or 0.0)
-        self._state.vram_used_gb = float(snapshot.get("vram_used_gb", 0.0) or 0.0)
-        self._state.touch()
+        get = snapshot.get
+
+        def _f(key: str) -> float:
+            return float(get(key) or 0.0)
+
+        def _i(key: str) -> int:
+            return int(get(key) or 0)
+
+        state = self._state
+        state.cpu_model = str(get("cpu_model", "Unknown"))
+        state.cpu_physical = _i("cpu_physical")
+        state.cpu_logical = _i("cpu_logical")
+        state.ram_total_gb = _f("ram_total_gb")
+        state.ram_free_gb = _f("ram_free_gb")
+        state.disk_total_gb = _f("disk_total_gb")
+        state.disk_free_gb = _f("disk_free_gb")
+        state.gpu_name = str(get("gpu_model", "Unknown"))
+        state.vram_total_gb = _f("vram_total_gb")
+        state.vram_used_gb = _f("vram_used_gb")
+        state.touch()
 
     async def _register_node(self, auto: bool) -> None:
         if not self._config.consent_accepted:
@@ -729,7 +974,11 @@ class AgentController:
             self._emit_status()
             return
 
-        coordinator_ok = await self._check_coordinator_once()
+        # Local model-cache collection overlaps the health probe's round-trip.
+        coordinator_ok, model_cache = await asyncio.gather(
+            self._check_coordinator_once(),
+            self._collect_model_cache(),
+        )
         self._state.coordinator_status = "ok" if coordinator_ok else "down"
         self._state.connected = coordinator_ok
         if not coordinator_ok:
@@ -755,8 +1004,6 @@ class AgentController:
             gpu_name = "CPU"
             vram_total = 1.0
 
-        model_cache = await self._collect_model_cache()
-
         payload = {
             "id": node_id,
             "gpu": gpu_name,
@@ -796,8 +1043,9 @@ class AgentController:
         self._state.registration_status = "registered" if registered else "not-registered"
         self._state.connected = coordinator_ok
         self._state.last_event = "node_registered" if registered else "node_register_failed"
-        self._state.model_cache = model_cache
+        self._state.set_model_cache(model_cache)
         self._state.touch()
+        self._mark_dirty()
 
         if self._config.node_id != node_id or issued_token:
             self._config.node_id = node_id
@@ -874,10 +1122,22 @@ class AgentController:
     async def _shutdown(self) -> None:
         await self._stop_runtime_tasks()
 
+        presence, self._offline_presence = self._offline_presence, None
+        if presence is not None and not presence.done():
+            # stop_services wakes _run right away; let the coordinator hear the node go offline
+            # before its client is closed underneath the request.
+            await asyncio.wait([asyncio.wrap_future(presence)], timeout=self.OFFLINE_PRESENCE_WAIT_SEC)
+
         if self._client:
             await self._client.close()
             self._client = None
         self._sandbox_runner = None
+        if self._trust:
+            # The next start loads a fresh TrustManager from disk, so a pending debounced save must land first.
+            self._trust.close()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
         known_node_id = self._config.node_id or self._state.node_id
         registered = bool(known_node_id)
@@ -907,11 +1167,39 @@ class AgentController:
             return False, "low_disk"
         return True, "ok"
 
-    def _submit_async(self, coro: Coroutine[Any, Any, Any]) -> None:
+    def _in_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _call_in_loop(self, callback) -> None:
+        if self._in_loop_thread():
+            callback()
+        else:
+            self._loop.call_soon_threadsafe(callback)
+
+    def _schedule_on(self, loop: asyncio.AbstractEventLoop, coro: Coroutine[Any, Any, Any]):
+        try:
+            same_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            same_loop = False
+        if same_loop:
+            return loop.create_task(coro)
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def _submit_async(self, coro: Coroutine[Any, Any, Any]) -> Future | asyncio.Task | None:
+        # Returns the scheduled future while services run; one-off actions on a private loop return None.
         if self._loop and self._loop.is_running():
-            future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+            # From the loop thread this is a plain create_task; only UI/other threads pay the threadsafe hop.
+            future = self._schedule_on(self._loop, coro)
+            # The loop only keeps weak references to tasks; hold them until they finish.
+            self._pending_submissions.add(future)
 
             def _done_callback(done_future) -> None:
+                self._pending_submissions.discard(done_future)
+                if done_future.cancelled():
+                    return
                 try:
                     done_future.result()
                 except Exception as exc:  # noqa: BLE001
@@ -919,17 +1207,18 @@ class AgentController:
                     self.emit("console", {"message": f"task_failed error={exc}"})
 
             future.add_done_callback(_done_callback)
-            return
+            return future
 
         # Fallback for one-off actions before services start.
         def _runner() -> None:
             try:
-                asyncio.run(coro)
+                self._run_on_new_loop(coro)
             except Exception as exc:  # noqa: BLE001
                 self._logger.warning("adhoc_async_failed", extra={"error": str(exc)})
                 self.emit("console", {"message": f"task_failed error={exc}"})
 
         threading.Thread(target=_runner, daemon=True).start()
+        return None
 
     async def _fetch_models(self) -> None:
         self.emit("models", {"items": []})
@@ -948,19 +1237,14 @@ class AgentController:
 
         normalized = self._normalize_models(items)
         self._config.model_cache = normalized
-        self._state.model_cache = normalized
+        self._state.set_model_cache(normalized)
         return normalized
 
     def _normalize_models(self, models: list[str]) -> list[str]:
-        unique: list[str] = []
-        seen: set[str] = set()
+        # Keyed case-insensitively; setdefault keeps the first spelling and position seen.
+        unique: dict[str, str] = {}
         for item in models:
             cleaned = str(item).strip()
-            if not cleaned:
-                continue
-            lowered = cleaned.lower()
-            if lowered in seen:
-                continue
-            seen.add(lowered)
-            unique.append(cleaned)
-        return unique[-32:]
+            if cleaned:
+                unique.setdefault(cleaned.lower(), cleaned)
+        return list(unique.values())[-32:]
@@ -1,15 +1,21 @@
 ﻿from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field, fields
-import json
+from functools import lru_cache
 import os
 from pathlib import Path
+import tempfile
+
+from app.json_codec import dumps_pretty, loads as json_loads
 
 
 APP_NAME = "ComputeFabric"
 CONFIG_FILENAME = "config.json"
 TRUST_FILENAME = "trust.json"
 
+# Last bytes written by save_config; lets repeated saves of an unchanged config skip the disk.
+_last_saved_blob: bytes | None = None
+
 
 def get_app_dir() -> Path:
     base = os.getenv("APPDATA") or str(Path.home())
@@ -28,7 +34,14 @@ def get_trust_path() -> Path:
     return get_app_dir() / TRUST_FILENAME
 
 
-@dataclass
+# TLS cert/key paths only change through the settings, so existence checks are cached until
+# the next save_config.
+@lru_cache(maxsize=8)
+def tls_path_exists(path: str) -> bool:
+    return Path(path).exists()
+
+
+@dataclass(slots=True)
 class AgentConfig:
     coordinator_url: str = "http://127.0.0.1:8000"
     api_token: str = ""
@@ -64,6 +77,8 @@ class AgentConfig:
     heartbeat_interval_sec: int = 10
     job_poll_interval_sec: int = 3
     request_timeout_sec: int = 15
+    use_uvloop: bool = True  # ignored where uvloop is not installed (e.g. Windows)
+    agent_executor_workers: int = 2
 
     register_endpoint: str = "/api/v1/nodes/register"
     heartbeat_endpoint: str = "/api/v1/nodes/{node_id}/heartbeat"
@@ -84,24 +99,23 @@ class AgentConfig:
     min_disk_gb: float = 20.0
 
 
+_AGENT_FIELDS = tuple(f.name for f in fields(AgentConfig))
+_AGENT_FIELD_SET = frozenset(_AGENT_FIELDS)
+
+
 def ensure_dirs() -> None:
     get_app_dir().mkdir(parents=True, exist_ok=True)
     get_log_dir().mkdir(parents=True, exist_ok=True)
 
 
 def _normalize_model_cache(models: list[str]) -> list[str]:
-    unique: list[str] = []
-    seen: set[str] = set()
+    # Keyed case-insensitively; setdefault keeps the first spelling and position seen.
+    unique: dict[str, str] = {}
     for item in models:
         cleaned = str(item).strip()
-        if not cleaned:
-            continue
-        lowered = cleaned.lower()
-        if lowered in seen:
-            continue
-        seen.add(lowered)
-        unique.append(cleaned)
-    return unique[-32:]
+        if cleaned:
+            unique.setdefault(cleaned.lower(), cleaned)
+    return list(unique.values())[-32:]
 
 
 def _is_legacy_openai_model(name: str) -> bool:
@@ -118,21 +132,20 @@ def load_config() -> AgentConfig:
         return cfg
 
     try:
-        data = json.loads(config_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        data = json_loads(config_path.read_bytes())
+    except ValueError:  # JSONDecodeError or invalid UTF-8
         backup = config_path.with_suffix(".invalid.json")
         config_path.replace(backup)
         save_config(cfg)
         return cfg
 
-    known_fields = {field.name for field in fields(cfg)}
-    for field in fields(cfg):
-        if field.name in data:
-            setattr(cfg, field.name, data[field.name])
+    for name in _AGENT_FIELDS:
+        if name in data:
+            setattr(cfg, name, data[name])
 
     # Runtime now uses fabric-local execution; keep persisted configs aligned.
     changed = False
-    if any(key not in known_fields for key in data.keys()):
+    if not _AGENT_FIELD_SET.issuperset(data):
         changed = True
 
     cfg.provider_hint = "fabric"
@@ -164,8 +177,25 @@ def load_config() -> AgentConfig:
 
 
 def save_config(cfg: AgentConfig) -> None:
+    global _last_saved_blob
+    blob = dumps_pretty(asdict(cfg))
+    config_path = get_config_path()
+    if blob == _last_saved_blob and config_path.exists():
+        return
+
     ensure_dirs()
-    get_config_path().write_text(
-        json.dumps(asdict(cfg), indent=2, sort_keys=True),
-        encoding="utf-8",
-    )
+    # Write-then-rename so a crash mid-save never leaves a truncated config behind. The UI and
+    # agent threads both save, so each write gets its own temp file.
+    fd, tmp_name = tempfile.mkstemp(prefix="config.", suffix=".json.tmp", dir=config_path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(blob)
+        os.replace(tmp_name, config_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _last_saved_blob = blob
+    tls_path_exists.cache_clear()
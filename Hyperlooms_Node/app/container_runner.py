@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import json
 import logging
 import re
 from dataclasses import dataclass
 from uuid import uuid4
 
+from app.json_codec import dumps as json_dumps
+
 
 class ContainerExecutionError(RuntimeError):
     pass
@@ -26,8 +27,12 @@ class ContainerExecutionConfig:
     no_new_privileges: bool
 
 
+_ERROR_TAIL_BYTES = 1200
+_UNSAFE_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_.-]+")
+
+
 def _sanitize_name(value: str) -> str:
-    cleaned = re.sub(r"[^a-zA-Z0-9_.-]+", "-", value.strip().lower())
+    cleaned = _UNSAFE_NAME_CHARS.sub("-", value.strip().lower())
     return cleaned[:20] or "job"
 
 
@@ -52,11 +57,12 @@ class DockerSandboxRunner:
             "mode": mode,
             "options": options,
         }
-        payload_raw = json.dumps(payload, ensure_ascii=True, separators=(",", ":")).encode("utf-8")
-        payload_b64 = base64.urlsafe_b64encode(payload_raw).decode("ascii")
+        # Entrypoint contract: the container reads one UTF-8 JSON document from stdin until EOF
+        # and writes its JSON result to stdout.
+        payload_raw = json_dumps(payload)
 
         container_name = f"cf-sbx-{_sanitize_name(job_id)}-{uuid4().hex[:6]}"
-        command = self._build_command(container_name=container_name, payload_b64=payload_b64)
+        command = self._build_command(container_name=container_name)
 
         self._logger.info(
             "container_exec_start",
@@ -65,37 +71,81 @@ class DockerSandboxRunner:
 
         proc = await asyncio.create_subprocess_exec(
             *command,
+            stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
+        stdout = bytearray()
+        stderr_tail = bytearray()
+        # Feed stdin and drain both output pipes concurrently so neither side blocks on a full
+        # pipe, and stderr progress does not accumulate for the whole run.
+        stdin_task = asyncio.create_task(self._write_stdin(proc.stdin, payload_raw))
+        stdout_task = asyncio.create_task(self._read_stdout(proc.stdout, stdout))
+        stderr_task = asyncio.create_task(self._read_stderr(proc.stderr, stderr_tail, job_id))
         try:
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=max(30, self._config.timeout_sec))
+            await asyncio.wait_for(
+                asyncio.gather(stdin_task, stdout_task, stderr_task, proc.wait()),
+                timeout=max(30, self._config.timeout_sec),
+            )
         except asyncio.TimeoutError as exc:
             proc.kill()
+            stdin_task.cancel()
+            stdout_task.cancel()
+            stderr_task.cancel()
             raise ContainerExecutionError("container_workload_timeout") from exc
 
-        stdout_text = stdout.decode("utf-8", errors="replace").strip()
-        stderr_text = stderr.decode("utf-8", errors="replace").strip()
         if proc.returncode != 0:
-            tail = stderr_text[-1200:] if stderr_text else stdout_text[-1200:]
+            # Only the tail is reported, so decode just that much of either stream.
+            tail = (bytes(stderr_tail).strip() or bytes(stdout).strip()[-_ERROR_TAIL_BYTES:]).decode(
+                "utf-8", errors="replace"
+            )
             raise ContainerExecutionError(f"container_workload_failed(rc={proc.returncode}): {tail}")
 
+        # json accepts UTF-8 bytes and surrounding whitespace, so large outputs skip a decoded copy.
         try:
-            parsed = json.loads(stdout_text)
-        except json.JSONDecodeError as exc:
-            raise ContainerExecutionError(f"container_output_invalid_json: {stdout_text[-500:]}") from exc
+            parsed = json.loads(stdout)
+        except ValueError as exc:  # JSONDecodeError or invalid UTF-8
+            tail = stdout.strip()[-500:].decode("utf-8", errors="replace")
+            raise ContainerExecutionError(f"container_output_invalid_json: {tail}") from exc
 
         if not isinstance(parsed, dict):
             raise ContainerExecutionError("container_output_invalid_shape")
         return parsed
 
-
-    def _build_command(self, *, container_name: str, payload_b64: str) -> list[str]:
+    @staticmethod
+    async def _write_stdin(stream: asyncio.StreamWriter, data: bytes) -> None:
+        try:
+            stream.write(data)
+            await stream.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # The container exited without reading its payload; its exit code reports why.
+            pass
+        finally:
+            stream.close()
+
+    @staticmethod
+    async def _read_stdout(stream: asyncio.StreamReader, buffer: bytearray) -> None:
+        while chunk := await stream.read(65536):
+            buffer += chunk
+
+    async def _read_stderr(self, stream: asyncio.StreamReader, tail: bytearray, job_id: str) -> None:
+        # Chunked rather than line-based so a runaway line cannot trip the reader's line limit.
+        while chunk := await stream.read(4096):
+            self._logger.debug(
+                "container_stderr",
+                extra={"job_id": job_id, "output": chunk.decode("utf-8", errors="replace")},
+            )
+            tail += chunk
+            if len(tail) > _ERROR_TAIL_BYTES:
+                del tail[:-_ERROR_TAIL_BYTES]
+
+    def _build_command(self, *, container_name: str) -> list[str]:
         cfg = self._config
         cmd = [
             "docker",
             "run",
             "--rm",
+            "-i",
             "--name",
             container_name,
             "--cpus",
@@ -116,11 +166,5 @@ class DockerSandboxRunner:
             cmd.extend(["--security-opt", "no-new-privileges:true"])
         if cfg.enable_gpu:
             cmd.extend(["--gpus", "all"])
-        cmd.extend(
-            [
-                "-e",
-                f"JOB_PAYLOAD_B64={payload_b64}",
-                cfg.image,
-            ]
-        )
+        cmd.append(cfg.image)
         return cmd
@@ -2,11 +2,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from pathlib import Path
+import random
 from typing import Any
 
 import httpx
 
+from app.config import tls_path_exists
+from app.json_codec import dumps as json_dumps, loads as json_loads
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One client per agent loop talks to a single coordinator; keep its connections warm between the
+# heartbeat (10s) and claim (3s) intervals so TLS handshakes are not repeated.
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60)
+
 
 class CoordinatorClient:
     def __init__(
@@ -27,6 +41,8 @@ class CoordinatorClient:
         self._logger = logger
         self._node_join_token = node_join_token.strip()
         self._node_token = node_token.strip()
+        # Per-client RNG for retry jitter, so nodes restarting together don't retry in lockstep.
+        self._rng = random.Random()
 
         verify = self._resolve_verify(tls_verify, tls_ca_cert_path)
         cert = self._resolve_client_cert(tls_client_cert_path, tls_client_key_path)
@@ -40,7 +56,11 @@ class CoordinatorClient:
             headers=headers,
             verify=verify,
             cert=cert,
+            limits=POOL_LIMITS,
+            # Heartbeat and claim overlap on one multiplexed connection (TLS coordinators only; no h2c).
+            http2=HTTP2_AVAILABLE,
         )
+        self._http_version = ""
 
     @property
     def base_url(self) -> str:
@@ -60,7 +80,7 @@ class CoordinatorClient:
             return False
 
         cert_path = tls_ca_cert_path.strip()
-        if cert_path and Path(cert_path).exists():
+        if cert_path and tls_path_exists(cert_path):
             return cert_path
         if cert_path:
             self._logger.warning("tls_ca_cert_missing", extra={"path": cert_path})
@@ -73,11 +93,11 @@ class CoordinatorClient:
         key_path = tls_client_key_path.strip()
         if not cert_path:
             return None
-        if not Path(cert_path).exists():
+        if not tls_path_exists(cert_path):
             self._logger.warning("tls_client_cert_missing", extra={"path": cert_path})
             return None
         if key_path:
-            if not Path(key_path).exists():
+            if not tls_path_exists(key_path):
                 self._logger.warning("tls_client_key_missing", extra={"path": key_path})
                 return None
             return (cert_path, key_path)
@@ -92,16 +112,6 @@ class CoordinatorClient:
         }
 
     def _format_error(self, exc: Exception) -> str:
-        if isinstance(exc, httpx.HTTPStatusError):
-            response = exc.response
-            request = exc.request
-            detail = (response.text or "").strip().replace("\n", " ")
-            if len(detail) > 220:
-                detail = f"{detail[:220]}..."
-            return (
-                f"status={response.status_code} method={request.method} "
-                f"url={request.url} detail={detail}"
-            )
         if isinstance(exc, httpx.RequestError):
             request = exc.request
             return (
@@ -110,6 +120,20 @@ class CoordinatorClient:
             )
         return str(exc)
 
+    def _format_status(self, response: httpx.Response) -> str:
+        request = response.request
+        size = len(response.content)
+        # Large error pages (proxy/HTML) aren't worth decoding just for a log line.
+        detail = ""
+        if size < 4096:
+            detail = (response.text or "").strip().replace("\n", " ")
+            if len(detail) > 220:
+                detail = f"{detail[:220]}..."
+        return (
+            f"status={response.status_code} method={request.method} "
+            f"url={request.url} bytes={size} detail={detail}"
+        )
+
     async def _request(
         self,
         method: str,
@@ -121,30 +145,51 @@ class CoordinatorClient:
     ) -> httpx.Response:
         if expected is None:
             expected = {200, 201, 202, 204}
+        content: bytes | None = None
+        if json_body is not None:
+            # Serialize once up front (orjson when installed) instead of on every retry inside httpx.
+            content = json_dumps(json_body)
+            headers = {"Content-Type": "application/json", **(headers or {})}
         last_exc: Exception | None = None
+        last_response: httpx.Response | None = None
         for attempt in range(1, retries + 1):
             try:
-                response = await self._client.request(method, url, json=json_body, headers=headers)
-                if response.status_code in expected:
-                    return response
-                if response.status_code == 404:
-                    return response
-                response.raise_for_status()
+                response = await self._client.request(method, url, content=content, headers=headers)
             except Exception as exc:  # noqa: BLE001
-                last_exc = exc
-                if attempt >= retries:
-                    self._logger.warning(
-                        "coordinator_request_failed method=%s url=%s attempts=%s error=%s",
-                        method,
-                        url,
-                        attempt,
-                        self._format_error(exc),
-                    )
-                    break
-                await asyncio.sleep(min(2**attempt, 8))
-        message = self._format_error(last_exc) if last_exc else "unknown_error"
+                last_exc, last_response = exc, None
+                retryable = True
+            else:
+                if response.http_version != self._http_version:
+                    self._http_version = response.http_version
+                    self._logger.debug("coordinator_http_version", extra={"version": self._http_version})
+                status = response.status_code
+                if status in expected or status == 404:
+                    return response
+                last_exc, last_response = None, response
+                # Client errors (auth, validation) won't change on retry; 429 is the exception.
+                retryable = not (400 <= status < 500) or status == 429
+
+            if attempt >= retries or not retryable:
+                break
+            await asyncio.sleep(self._rng.uniform(0, min(8.0, 0.5 * 2**attempt)))
+
+        message = self._describe_failure(last_exc, last_response)
+        self._logger.warning(
+            "coordinator_request_failed method=%s url=%s attempts=%s error=%s",
+            method,
+            url,
+            attempt,
+            message,
+        )
         raise RuntimeError(f"coordinator_request_failed: {message}")
 
+    def _describe_failure(self, exc: Exception | None, response: httpx.Response | None) -> str:
+        if response is not None:
+            return self._format_status(response)
+        if exc is not None:
+            return self._format_error(exc)
+        return "unknown_error"
+
     async def get_health(self, endpoint: str) -> bool:
         try:
             response = await self._request("GET", endpoint, expected={200})
@@ -158,7 +203,7 @@ class CoordinatorClient:
         if response.status_code == 404:
             self._logger.warning("register_endpoint_missing", extra={"endpoint": endpoint})
             return None
-        return response.json()
+        return json_loads(response.content)
 
     async def heartbeat(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any] | None:
         response = await self._request(
@@ -171,13 +216,13 @@ class CoordinatorClient:
         if response.status_code == 404:
             self._logger.warning("heartbeat_endpoint_missing", extra={"endpoint": endpoint})
             return None
-        return response.json()
+        return json_loads(response.content)
 
     async def claim_job(self, endpoint: str) -> dict[str, Any] | None:
         response = await self._request("GET", endpoint, headers=self._node_headers(), expected={200, 204})
         if response.status_code in {204, 404}:
             return None
-        return response.json()
+        return json_loads(response.content)
 
     async def submit_result(self, endpoint: str, payload: dict[str, Any]) -> bool:
         response = await self._request(
@@ -202,7 +247,7 @@ class CoordinatorClient:
     async def submit_job(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any] | None:
         response = await self._request("POST", endpoint, payload, expected={200, 201, 202})
         if response.status_code in {200, 201, 202}:
-            return response.json()
+            return json_loads(response.content)
         return None
 
     async def list_jobs(self, endpoint: str, status_filter: str | None = None) -> list[dict[str, Any]]:
@@ -212,7 +257,7 @@ class CoordinatorClient:
             url = f"{endpoint}{separator}status={status_filter}"
 
         response = await self._request("GET", url, headers=self._node_headers(), expected={200})
-        data = response.json()
+        data = json_loads(response.content)
         if isinstance(data, dict) and isinstance(data.get("items"), list):
             return [item for item in data["items"] if isinstance(item, dict)]
         return []
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import ctypes
+from dataclasses import dataclass
+from functools import lru_cache
+import sys
+
+# Device name, total memory and compute capability straight from the CUDA driver, so GPU
+# detection does not have to import torch. No context is created (cuMemGetInfo would need
+# one, and a primary context pins a few hundred MB of VRAM); live usage comes from NVML.
+CUDA_SUCCESS = 0
+CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MAJOR = 75
+CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MINOR = 76
+
+if sys.platform == "win32":
+    _LIBRARY_NAMES = ("nvcuda.dll",)
+else:
+    _LIBRARY_NAMES = ("libcuda.so.1", "libcuda.so")
+
+
+@dataclass(slots=True, frozen=True)
+class CudaDevice:
+    name: str
+    total_bytes: int
+    capability: tuple[int, int]
+
+
+def _load_library() -> ctypes.CDLL | None:
+    for name in _LIBRARY_NAMES:
+        try:
+            return ctypes.CDLL(name)
+        except OSError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=1)
+def primary_device() -> CudaDevice | None:
+    lib = _load_library()
+    if lib is None:
+        return None
+    try:
+        if lib.cuInit(0) != CUDA_SUCCESS:
+            return None
+        count = ctypes.c_int()
+        if lib.cuDeviceGetCount(ctypes.byref(count)) != CUDA_SUCCESS or count.value < 1:
+            return None
+        device = ctypes.c_int()
+        if lib.cuDeviceGet(ctypes.byref(device), 0) != CUDA_SUCCESS:
+            return None
+
+        name = ctypes.create_string_buffer(256)
+        if lib.cuDeviceGetName(name, len(name), device) != CUDA_SUCCESS:
+            return None
+        total = ctypes.c_size_t()
+        if lib.cuDeviceTotalMem_v2(ctypes.byref(total), device) != CUDA_SUCCESS:
+            return None
+        major = ctypes.c_int()
+        minor = ctypes.c_int()
+        if lib.cuDeviceGetAttribute(ctypes.byref(major), CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MAJOR, device) != CUDA_SUCCESS:
+            return None
+        if lib.cuDeviceGetAttribute(ctypes.byref(minor), CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MINOR, device) != CUDA_SUCCESS:
+            return None
+    except (AttributeError, OSError):
+        return None
+
+    return CudaDevice(
+        name=name.value.decode("utf-8", errors="replace").strip() or "NVIDIA GPU",
+        total_bytes=total.value,
+        capability=(major.value, minor.value),
+    )
@@ -1,60 +1,148 @@
 ﻿from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 import os
 import platform
-import subprocess
+import threading
+import time
 from typing import Any
 
 import psutil
 
-from app.gpu_detector import detect_gpu
+from app import cuda_driver
+from app.gpu_detector import (
+    cuda_available,
+    cuda_device_capability,
+    detect_gpu,
+    display_adapter_values,
+    torch_available,
+)
 
+try:
+    import winreg
+except ImportError:  # non-Windows hosts report via platform.processor() and the GPU detector
+    winreg = None
 
-def _run_cmd(cmd: list[str]) -> str:
-    try:
-        return subprocess.check_output(cmd, text=True, stderr=subprocess.DEVNULL).strip()
-    except Exception:
-        return ""
+# GPU detection may still fall back to nvidia-smi/wmic subprocesses; it runs on a daemon thread
+# while the CPU, memory and disk probes proceed, so a snapshot costs the slower of the two, not
+# the sum. A hung subprocess costs the snapshot its GPU fields, not interpreter exit.
+GPU_PROBE_TIMEOUT_SEC = 20.0
+# The probe still in flight, if any. A probe stuck past its timeout is joined again by the next
+# snapshot rather than having another thread (and subprocess) started beside it.
+_gpu_probe: tuple[threading.Thread, list[Any]] | None = None
+_gpu_probe_lock = threading.Lock()
 
+# Discovery and the UI's detail refresh can ask back to back; within this window they share one probe.
+SNAPSHOT_TTL_SEC = 5.0
+_snapshot_cache: tuple[float, str | None, dict[str, Any], list[str]] | None = None
 
-def _parse_wmic_list(output: str) -> list[str]:
-    lines = [line.strip() for line in output.splitlines() if line.strip()]
-    if lines and lines[0].lower().startswith("name"):
-        lines = lines[1:]
-    return lines
+_CPU_KEY = r"HARDWARE\DESCRIPTION\System\CentralProcessor\0"
 
 
+# CPU and adapter names are fixed for the life of the process, and registry reads replace the
+# wmic subprocess (deprecated, and seconds on a cold start) that used to run on every snapshot.
+@lru_cache(maxsize=1)
 def _cpu_model() -> str:
-    output = _run_cmd(["wmic", "cpu", "get", "name"])
-    lines = _parse_wmic_list(output)
-    return lines[0] if lines else (platform.processor() or "Unknown")
+    if winreg is not None:
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _CPU_KEY) as key:
+                name = str(winreg.QueryValueEx(key, "ProcessorNameString")[0]).strip()
+            if name:
+                return name
+        except OSError:
+            pass
+    return platform.processor() or "Unknown"
+
+
+@lru_cache(maxsize=1)
+def _gpu_models() -> tuple[str, ...]:
+    models: list[str] = []
+    for name in display_adapter_values("DriverDesc"):
+        if name not in models:
+            models.append(name)
+    return tuple(models)
+
+
+def _probe_gpu(result: list[Any]) -> None:
+    try:
+        result.append(detect_gpu())
+    except BaseException as exc:  # handed back to the snapshot thread
+        result.append(exc)
+
+
+def _start_gpu_probe() -> tuple[threading.Thread, list[Any]]:
+    global _gpu_probe
+    with _gpu_probe_lock:
+        probe = _gpu_probe
+        if probe is None or not probe[0].is_alive():
+            result: list[Any] = []
+            thread = threading.Thread(target=_probe_gpu, args=(result,), name="gpu-probe", daemon=True)
+            thread.start()
+            probe = _gpu_probe = (thread, result)
+        return probe
+
+
+@lru_cache(maxsize=1)
+def _cpu_physical() -> int:
+    # psutil counts cores system-wide while _cpu_logical follows this process's affinity; inside a
+    # restricted cgroup or container the usable cores cannot exceed the usable logical CPUs.
+    physical = psutil.cpu_count(logical=False) or 0
+    logical = _cpu_logical()
+    return min(physical, logical) if logical else physical
+
+
+@lru_cache(maxsize=1)
+def _cpu_logical() -> int:
+    # On Linux the affinity mask is one syscall and reflects the CPUs this process may actually use.
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return len(os.sched_getaffinity(0))
+        except OSError:
+            pass
+    return psutil.cpu_count(logical=True) or 0
 
 
-def _gpu_models() -> list[str]:
-    output = _run_cmd(["wmic", "path", "win32_VideoController", "get", "name"])
-    return _parse_wmic_list(output)
+# Checked in order; the first substring found in the lowered model name wins.
+_GPU_VENDOR_MARKERS = (
+    ("nvidia", "nvidia"),
+    ("amd", "amd"),
+    ("radeon", "amd"),
+    ("intel", "intel"),
+)
 
 
+@lru_cache(maxsize=32)
 def _gpu_vendor(model: str) -> str:
     lower = model.lower()
-    if "nvidia" in lower:
-        return "nvidia"
-    if "amd" in lower or "radeon" in lower:
-        return "amd"
-    if "intel" in lower:
-        return "intel"
+    for marker, vendor in _GPU_VENDOR_MARKERS:
+        if marker in lower:
+            return vendor
     return "unknown"
 
 
 def collect_device_snapshot(node_id: str | None = None) -> tuple[dict[str, Any], list[str]]:
+    global _snapshot_cache
+    now = time.monotonic()
+    cached = _snapshot_cache
+    if cached is not None and cached[1] == node_id and now - cached[0] < SNAPSHOT_TTL_SEC:
+        snapshot, debug = cached[2], cached[3]
+    else:
+        snapshot, debug = _collect_device_snapshot(node_id)
+        _snapshot_cache = (now, node_id, snapshot, debug)
+    # Callers annotate the snapshot (eligibility etc.), so each gets its own copy.
+    return dict(snapshot), list(debug)
+
+
+def _collect_device_snapshot(node_id: str | None) -> tuple[dict[str, Any], list[str]]:
     debug: list[str] = []
     debug.append(f"platform={platform.platform()}")
     debug.append(f"python={platform.python_version()}")
+    gpu_probe, gpu_result = _start_gpu_probe()
 
     cpu_model = _cpu_model()
-    cpu_physical = psutil.cpu_count(logical=False) or 0
-    cpu_logical = psutil.cpu_count(logical=True) or 0
+    cpu_physical = _cpu_physical()
+    cpu_logical = _cpu_logical()
 
     memory = psutil.virtual_memory()
     ram_total = round(memory.total / (1024**3), 2)
@@ -68,8 +156,15 @@ def collect_device_snapshot(node_id: str | None = None) -> tuple[dict[str, Any],
     disk_free = round(disk_usage.free / (1024**3), 2)
     debug.append(f"disk_probe=total_gb={disk_total} free_gb={disk_free}")
 
-    gpu_info = detect_gpu()
     gpu_models = _gpu_models()
+    gpu_probe.join(GPU_PROBE_TIMEOUT_SEC)
+    if not gpu_result:
+        debug.append("gpu_probe=timeout")
+        gpu_info = None
+    elif isinstance(gpu_result[0], BaseException):
+        raise gpu_result[0]
+    else:
+        gpu_info = gpu_result[0]
     gpu_present = bool(gpu_models) or (gpu_info is not None)
 
     gpu_model = gpu_info.name if gpu_info else (gpu_models[0] if gpu_models else "None")
@@ -77,21 +172,19 @@ def collect_device_snapshot(node_id: str | None = None) -> tuple[dict[str, Any],
     vram_used = gpu_info.vram_used_gb if gpu_info else 0.0
 
     compute_capability = "None"
-    cuda_available = False
-    try:
-        import torch
-
-        cuda_available = torch.cuda.is_available()
-        if cuda_available:
-            capability = torch.cuda.get_device_capability(0)
-            compute_capability = f"{capability[0]}.{capability[1]}"
-    except Exception:
+    has_cuda = cuda_available()
+    capability = cuda_device_capability()
+    if capability is not None:
+        compute_capability = f"{capability[0]}.{capability[1]}"
+    if cuda_driver.primary_device() is not None:
+        debug.append("gpu_detector=cuda-driver")
+    elif not torch_available():
         debug.append("gpu_detector=torch:none")
     else:
-        debug.append("gpu_detector=torch:cuda" if cuda_available else "gpu_detector=torch:present")
+        debug.append("gpu_detector=torch:cuda" if has_cuda else "gpu_detector=torch:present")
 
     if gpu_models:
-        debug.append("gpu_detector=windows-cim")
+        debug.append("gpu_detector=windows-registry")
 
     snapshot = {
         "node_id": node_id or "-",
@@ -109,35 +202,59 @@ def collect_device_snapshot(node_id: str | None = None) -> tuple[dict[str, Any],
         "vram_total_gb": vram_total,
         "vram_used_gb": vram_used,
         "compute_capability": compute_capability,
-        "cuda_available": cuda_available,
+        "cuda_available": has_cuda,
         "rocm_available": False,
     }
     return snapshot, debug
 
 
-def format_snapshot(snapshot: dict[str, Any]) -> str:
-    lines = [
-        f"Node ID: {snapshot.get('node_id', '-')}",
-        f"Collected At: {snapshot.get('collected_at', '-')}",
+_SNAPSHOT_TEMPLATE = "\n".join(
+    [
+        "Node ID: {node_id}",
+        "Collected At: {collected_at}",
         "",
-        f"CPU Model: {snapshot.get('cpu_model', 'Unknown')}",
-        f"CPU Cores: physical={snapshot.get('cpu_physical', 0)} logical={snapshot.get('cpu_logical', 0)}",
-        f"RAM: total={snapshot.get('ram_total_gb', 0)} GB free={snapshot.get('ram_free_gb', 0)} GB",
-        f"Disk: total={snapshot.get('disk_total_gb', 0)} GB free={snapshot.get('disk_free_gb', 0)} GB",
+        "CPU Model: {cpu_model}",
+        "CPU Cores: physical={cpu_physical} logical={cpu_logical}",
+        "RAM: total={ram_total_gb} GB free={ram_free_gb} GB",
+        "Disk: total={disk_total_gb} GB free={disk_free_gb} GB",
         "",
-        f"GPU Present: {snapshot.get('gpu_present', False)}",
-        f"GPU Vendor: {snapshot.get('gpu_vendor', 'unknown')}",
-        f"GPU Model: {snapshot.get('gpu_model', 'None')}",
-        f"VRAM: used={snapshot.get('vram_used_gb', 0)} GB total={snapshot.get('vram_total_gb', 0)} GB",
-        f"Compute Capability: {snapshot.get('compute_capability', 'None')}",
-        f"CUDA Available: {snapshot.get('cuda_available', False)}",
-        f"ROCm Available: {snapshot.get('rocm_available', False)}",
+        "GPU Present: {gpu_present}",
+        "GPU Vendor: {gpu_vendor}",
+        "GPU Model: {gpu_model}",
+        "VRAM: used={vram_used_gb} GB total={vram_total_gb} GB",
+        "Compute Capability: {compute_capability}",
+        "CUDA Available: {cuda_available}",
+        "ROCm Available: {rocm_available}",
     ]
+)
+_SNAPSHOT_DEFAULTS: dict[str, Any] = {
+    "node_id": "-",
+    "collected_at": "-",
+    "cpu_model": "Unknown",
+    "cpu_physical": 0,
+    "cpu_logical": 0,
+    "ram_total_gb": 0,
+    "ram_free_gb": 0,
+    "disk_total_gb": 0,
+    "disk_free_gb": 0,
+    "gpu_present": False,
+    "gpu_vendor": "unknown",
+    "gpu_model": "None",
+    "vram_used_gb": 0,
+    "vram_total_gb": 0,
+    "compute_capability": "None",
+    "cuda_available": False,
+    "rocm_available": False,
+}
+
+
+def format_snapshot(snapshot: dict[str, Any]) -> str:
+    text = _SNAPSHOT_TEMPLATE.format_map({**_SNAPSHOT_DEFAULTS, **snapshot})
 
     capability_message = str(snapshot.get("capability_message", "") or "").strip()
     if capability_message:
-        lines.extend(["", f"Capability Check: {capability_message}"])
-    return "\n".join(lines)
+        text = f"{text}\n\nCapability Check: {capability_message}"
+    return text
 
 
 def format_debug_trace(lines: list[str]) -> str:
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from collections import deque
+import queue
+import socket
+import threading
+from typing import Any, Iterable
+
+DEFAULT_MAXLEN = 1024
+DEFAULT_COALESCE_TYPES = ("status",)
+
+
+# deque append/popleft are atomic, so producers only pay for setting the wakeup event.
+# With a wakeup socket attached, one byte is sent per drain cycle so the consumer can
+# wait on it with selectors alongside other fds.
+# The queue is bounded (a slow consumer loses the oldest events), and an event whose type
+# is in coalesce_types replaces a queued tail event of the same type, since only the latest
+# snapshot matters to consumers.
+class EventQueue:
+    def __init__(
+        self,
+        wakeup_sock: socket.socket | None = None,
+        maxlen: int | None = DEFAULT_MAXLEN,
+        coalesce_types: Iterable[str] = DEFAULT_COALESCE_TYPES,
+    ) -> None:
+        self._items: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self._ready = threading.Event()
+        self._wakeup_sock = wakeup_sock
+        self._coalesce_types = frozenset(coalesce_types)
+        # Only producers coordinate with each other; the consumer side stays lock-free.
+        self._put_lock = threading.Lock()
+
+    def put(self, event: dict[str, Any]) -> None:
+        event_type = event.get("type")
+        with self._put_lock:
+            if event_type in self._coalesce_types:
+                try:
+                    # The consumer only pops from the left, so the tail can only vanish by emptying the deque.
+                    if self._items[-1].get("type") == event_type:
+                        self._items[-1] = event
+                        return
+                except IndexError:
+                    pass
+            self._items.append(event)
+        if self._ready.is_set():
+            return
+        self._ready.set()
+        if self._wakeup_sock is not None:
+            try:
+                self._wakeup_sock.send(b"\0")
+            except OSError:
+                # Socket buffer full means a wakeup is already pending.
+                pass
+
+    def get_nowait(self) -> dict[str, Any]:
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def wait(self, timeout: float | None = None) -> bool:
+        if not self._items:
+            # A put() racing with drain() can leave the flag set over an empty deque; clear it so
+            # this blocks instead of returning at once. Recheck after clearing: an item appended in
+            # between saw the flag still set and did not set it again.
+            self._ready.clear()
+            if not self._items:
+                self._ready.wait(timeout)
+        return bool(self._items)
+
+    def drain(self, limit: int) -> list[dict[str, Any]]:
+        # Clear before popping so a put racing with the drain re-arms the wakeup.
+        self._ready.clear()
+        batch: list[dict[str, Any]] = []
+        popleft = self._items.popleft
+        while len(batch) < limit:
+            try:
+                batch.append(popleft())
+            except IndexError:
+                break
+        return batch
+
+    def __len__(self) -> int:
+        return len(self._items)
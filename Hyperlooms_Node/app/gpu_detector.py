@@ -1,14 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import csv
+from functools import lru_cache
+import glob
 import logging
 import subprocess
+import sys
+from typing import Any
 
 import psutil
 
+from app import cuda_driver, nvml
 
-@dataclass
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+NVIDIA_PCI_VENDOR_ID = "0x10de"
+# Display adapter device class; each numbered subkey is one installed adapter.
+_DISPLAY_CLASS_KEY = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+
+
+@dataclass(slots=True)
 class GPUInfo:
     name: str
     vram_total_gb: float
@@ -16,28 +30,112 @@ class GPUInfo:
 
 
 def _run_command(cmd: list[str]) -> str:
+    # Bytes plus one ASCII decode: the nvidia-smi/wmic fields read here are ASCII, and this skips
+    # locale codec lookup and newline translation (splitlines handles \r\n).
     try:
-        return subprocess.check_output(cmd, text=True, stderr=subprocess.DEVNULL).strip()
+        output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL)
     except Exception:
         return ""
+    return output.decode("ascii", "ignore").strip()
 
 
-def _detect_gpu_from_torch(logger: logging.Logger | None = None) -> GPUInfo | None:
+# The torch import, CUDA availability and device properties are fixed for the life of the
+# process but cost driver round-trips (and lock contention) per query, so they are resolved once.
+@lru_cache(maxsize=1)
+def _import_torch() -> tuple[Any | None, str]:
     try:
         import torch
     except Exception as exc:
-        if logger:
-            logger.warning("torch_not_available", extra={"error": str(exc)})
+        return None, str(exc)
+    return torch, ""
+
+
+def torch_available() -> bool:
+    return _import_torch()[0] is not None
+
+
+@lru_cache(maxsize=1)
+def cuda_available() -> bool:
+    if cuda_driver.primary_device() is not None:
+        return True
+    return _torch_cuda_usable()
+
+
+@lru_cache(maxsize=1)
+def cuda_device_capability() -> tuple[int, int] | None:
+    device = cuda_driver.primary_device()
+    if device is not None:
+        return device.capability
+    if not cuda_available():
+        return None
+    torch, _ = _import_torch()
+    try:
+        major, minor = torch.cuda.get_device_capability(0)
+    except Exception:
         return None
+    return major, minor
 
+
+@lru_cache(maxsize=1)
+def _cuda_device_info() -> tuple[str, int]:
+    torch, _ = _import_torch()
+    return torch.cuda.get_device_name(0), torch.cuda.get_device_properties(0).total_memory
+
+
+def invalidate_gpu_cache() -> None:
+    _import_torch.cache_clear()
+    cuda_available.cache_clear()
+    _torch_cuda_usable.cache_clear()
+    cuda_device_capability.cache_clear()
+    _cuda_device_info.cache_clear()
+    nvidia_hardware_present.cache_clear()
+    cuda_driver.primary_device.cache_clear()
+
+
+def _detect_gpu_from_cuda_driver() -> GPUInfo | None:
+    device = cuda_driver.primary_device()
+    if device is None:
+        return None
+    memory = nvml.memory_info()
+    used_gb = memory.used / (1024**3) if memory is not None else 0.0
+    return GPUInfo(
+        name=device.name,
+        vram_total_gb=round(device.total_bytes / (1024**3), 2),
+        vram_used_gb=round(used_gb, 2),
+    )
+
+
+@lru_cache(maxsize=1)
+def _torch_cuda_usable() -> bool:
+    # Torch fallback only: the driver API answers without importing torch or creating a context.
+    torch, _ = _import_torch()
+    if torch is None:
+        return False
     try:
         if not torch.cuda.is_available():
+            return False
+        # is_available() can report True for a driver that cannot actually run kernels; CUDA errors
+        # are lazy, so force one tiny allocation now instead of failing later in every query.
+        torch.empty(1, device="cuda").item()
+    except Exception:
+        return False
+    return True
+
+
+def _detect_gpu_from_torch(logger: logging.Logger | None = None) -> GPUInfo | None:
+    torch, import_error = _import_torch()
+    if torch is None:
+        if logger:
+            logger.warning("torch_not_available", extra={"error": import_error})
+        return None
+
+    try:
+        if not _torch_cuda_usable():
             return None
 
         device_index = 0
-        name = torch.cuda.get_device_name(device_index)
-        props = torch.cuda.get_device_properties(device_index)
-        total_gb = props.total_memory / (1024**3)
+        name, total_memory = _cuda_device_info()
+        total_gb = total_memory / (1024**3)
         used_gb = torch.cuda.memory_reserved(device_index) / (1024**3)
 
         try:
@@ -54,7 +152,59 @@ def _detect_gpu_from_torch(logger: logging.Logger | None = None) -> GPUInfo | No
         return None
 
 
+def display_adapter_values(value_name: str) -> list[str]:
+    # Reads one string value from every installed display adapter; empty off Windows.
+    if winreg is None:
+        return []
+    values: list[str] = []
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _DISPLAY_CLASS_KEY) as class_key:
+            index = 0
+            while True:
+                try:
+                    subkey_name = winreg.EnumKey(class_key, index)
+                except OSError:
+                    break
+                index += 1
+                try:
+                    with winreg.OpenKey(class_key, subkey_name) as adapter_key:
+                        value = str(winreg.QueryValueEx(adapter_key, value_name)[0]).strip()
+                except OSError:
+                    # "Properties" and similar non-adapter subkeys are unreadable or lack the value.
+                    continue
+                if value:
+                    values.append(value)
+    except OSError:
+        return []
+    return values
+
+
+@lru_cache(maxsize=1)
+def nvidia_hardware_present() -> bool:
+    # nvidia-smi can be installed without NVIDIA hardware (container toolkit, leftover drivers),
+    # so the PCI vendor id decides whether running it is worthwhile.
+    if sys.platform == "win32":
+        return any("VEN_10DE" in device_id.upper() for device_id in display_adapter_values("MatchingDeviceId"))
+    if sys.platform.startswith("linux"):
+        vendor_paths = glob.glob("/sys/bus/pci/devices/*/vendor")
+        if not vendor_paths:
+            # No sysfs view of the PCI bus; let nvidia-smi decide as before.
+            return True
+        for path in vendor_paths:
+            try:
+                with open(path, encoding="ascii") as handle:
+                    if handle.read().strip().lower() == NVIDIA_PCI_VENDOR_ID:
+                        return True
+            except OSError:
+                continue
+        return False
+    return True
+
+
 def _detect_gpu_from_nvidia_smi(logger: logging.Logger | None = None) -> GPUInfo | None:
+    if not nvidia_hardware_present():
+        return None
+
     output = _run_command(
         [
             "nvidia-smi",
@@ -94,11 +244,26 @@ def _detect_gpu_from_wmic(logger: logging.Logger | None = None) -> GPUInfo | Non
     if len(rows) < 2:
         return None
 
+    # wmic emits a header row (Node,AdapterRAM,Name) then one row per adapter. Rows are split at most
+    # len(header)-1 times so a comma inside the trailing Name column stays intact.
+    header = [column.strip() for column in rows[0].split(",")]
+    try:
+        name_index = header.index("Name")
+        ram_index = header.index("AdapterRAM")
+    except ValueError:
+        if logger:
+            logger.warning("wmic_gpu_parse_failed", extra={"error": f"unexpected_header: {rows[0]}"})
+        return None
+
+    max_split = len(header) - 1
     candidates: list[tuple[int, str]] = []
     try:
-        for row in csv.DictReader(rows):
-            name = (row.get("Name") or "").strip()
-            raw_adapter_ram = (row.get("AdapterRAM") or "").strip()
+        for row in rows[1:]:
+            columns = row.split(",", max_split)
+            if len(columns) <= max(name_index, ram_index):
+                continue
+            name = columns[name_index].strip()
+            raw_adapter_ram = columns[ram_index].strip()
             if not name or not raw_adapter_ram:
                 continue
             adapter_ram = int(raw_adapter_ram)
@@ -122,6 +287,11 @@ def _detect_gpu_from_wmic(logger: logging.Logger | None = None) -> GPUInfo | Non
 
 
 def detect_gpu(logger: logging.Logger | None = None) -> GPUInfo | None:
+    # The driver API answers without importing torch; torch is only loaded when it cannot.
+    gpu = _detect_gpu_from_cuda_driver()
+    if gpu:
+        return gpu
+
     gpu = _detect_gpu_from_torch(logger)
     if gpu:
         return gpu
@@ -138,15 +308,19 @@ def detect_gpu(logger: logging.Logger | None = None) -> GPUInfo | None:
 
 
 def get_vram_used_gb(logger: logging.Logger | None = None) -> float:
+    memory = nvml.memory_info()
+    if memory is not None:
+        return round(memory.used / (1024**3), 2)
+
     gpu = _detect_gpu_from_nvidia_smi(logger)
     if gpu:
         return gpu.vram_used_gb
 
-    try:
-        import torch
-        if not torch.cuda.is_available():
-            return 0.0
+    torch, _ = _import_torch()
+    if torch is None or not cuda_available():
+        return 0.0
 
+    try:
         try:
             free_bytes, total_bytes = torch.cuda.mem_get_info(0)
             used_gb = max(0.0, (total_bytes - free_bytes) / (1024**3))
@@ -7,6 +7,8 @@ from app.gpu_detector import get_vram_used_gb
 from app.state import AgentState
 from app.coordinator_client import CoordinatorClient
 
+_IDLE_STATUSES = frozenset({"idle", ""})
+
 
 async def _sleep_or_stop(stop_event: asyncio.Event, seconds: int) -> None:
     try:
@@ -33,7 +35,14 @@ async def heartbeat_loop(
             await _sleep_or_stop(stop_event, interval_sec)
             continue
 
-        jobs_running = 0 if state.current_job_status in {"idle", ""} else 1
+        if state.last_heartbeat is not None:
+            # Job status and presence reports also heartbeat; don't repeat one the coordinator just got.
+            since_last = (datetime.now() - state.last_heartbeat).total_seconds()
+            if 0 <= since_last < interval_sec:
+                await _sleep_or_stop(stop_event, interval_sec - since_last)
+                continue
+
+        jobs_running = 0 if state.current_job_status in _IDLE_STATUSES else 1
         payload = {
             "status": "busy" if jobs_running > 0 else "healthy",
             "vram_used_gb": get_vram_used_gb(logger),
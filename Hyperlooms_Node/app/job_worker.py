@@ -2,17 +2,43 @@
 
 import asyncio
 from datetime import datetime
-from time import perf_counter
+import os
+from time import perf_counter, perf_counter_ns
 from typing import Any, Callable
 
 from app.container_runner import DockerSandboxRunner
 from app.coordinator_client import CoordinatorClient
 from app.gpu_detector import get_vram_used_gb
-from app.models import JobPayload
+from app.models import JobPayload, detect_task_mode, preview
 from app.state import AgentState
 from app.trust_manager import TrustManager
 
-TASK_MODES = {"train", "finetune", "inference", "evaluation"}
+NOW_ISO_CACHE_NS = 1_000_000
+
+
+def _simulated_latency_sec() -> float:
+    try:
+        return max(0.0, float(os.getenv("HYPERLOOMS_SIMULATE_LATENCY") or 0))
+    except ValueError:
+        return 0.0
+
+
+# Artificial delay for local inference, in seconds; demos can set HYPERLOOMS_SIMULATE_LATENCY=0.12.
+SIMULATED_LATENCY_SEC = _simulated_latency_sec()
+
+_now_iso_at_ns = 0
+_now_iso_cached = ""
+
+
+def _now_iso() -> str:
+    # Task events fired back to back share one timestamp. Local time on purpose: the agent and UI
+    # order task snapshots by comparing these strings with their own datetime.now() values.
+    global _now_iso_at_ns, _now_iso_cached
+    now_ns = perf_counter_ns()
+    if not _now_iso_cached or now_ns - _now_iso_at_ns >= NOW_ISO_CACHE_NS:
+        _now_iso_cached = datetime.now().isoformat()
+        _now_iso_at_ns = now_ns
+    return _now_iso_cached
 
 
 def _normalized_options(params: dict[str, Any]) -> dict[str, Any]:
@@ -70,11 +96,13 @@ def _mark_model_cached(state: AgentState, model: str) -> None:
     cleaned = model.strip()
     if not cleaned:
         return
-    known = {item.lower() for item in state.model_cache}
-    if cleaned.lower() in known:
+    lowered = cleaned.lower()
+    if lowered in state.model_cache_lc:
         return
     state.model_cache.append(cleaned)
-    state.model_cache = state.model_cache[-32:]
+    state.model_cache_lc.add(lowered)
+    if len(state.model_cache) > 32:
+        state.set_model_cache(state.model_cache[-32:])
 
 
 def _emit_task_event(
@@ -89,22 +117,6 @@ def _emit_task_event(
         return
 
 
-def _detect_task_mode(job: JobPayload) -> str:
-    raw_mode = str(job.params.get("mode") or "").strip().lower()
-    if raw_mode in TASK_MODES:
-        return raw_mode
-
-    lowered = job.prompt.lower()
-    marker = "workload_mode:"
-    if marker in lowered:
-        tail = lowered.split(marker, 1)[1].strip()
-        candidate = tail.splitlines()[0].strip().split(" ", 1)[0]
-        if candidate in TASK_MODES:
-            return candidate
-
-    return "inference"
-
-
 async def _emit_runtime_heartbeat(
     *,
     state: AgentState,
@@ -135,11 +147,12 @@ async def _run_local_inference(
     job: JobPayload,
     options: dict[str, Any],
     model_name: str,
+    mode: str,
 ) -> dict[str, Any]:
-    await asyncio.sleep(0.12)
+    if SIMULATED_LATENCY_SEC:
+        await asyncio.sleep(SIMULATED_LATENCY_SEC)
     max_tokens = int(options.get("max_tokens") or 256)
     temperature = float(options.get("temperature") or 0.2)
-    mode = _detect_task_mode(job)
     summary = {
         "mode": mode,
         "model": model_name,
@@ -178,6 +191,9 @@ async def job_worker_loop(
     _ = inference
     _ = auto_download_models
     _ = provider_hint
+    # Split once so per-job URLs are plain concatenation instead of a str.format parse.
+    result_prefix, _, result_suffix = result_endpoint_template.partition("{job_id}")
+    fail_prefix, _, fail_suffix = fail_endpoint_template.partition("{job_id}")
     while not stop_event.is_set():
         if not state.node_id:
             await _sleep_or_stop(stop_event, poll_interval_sec)
@@ -210,9 +226,9 @@ async def job_worker_loop(
         state.current_job_status = "running"
         state.last_event = "job_started"
         state.touch()
-        task_mode = _detect_task_mode(job)
-        claimed_at = datetime.now().isoformat()
-        prompt_preview = job.prompt.strip().replace("\n", " ")[:240]
+        task_mode = detect_task_mode(job.params.get("mode"), job.prompt)
+        claimed_at = _now_iso()
+        prompt_preview = preview(job.prompt)
         _emit_task_event(
             event_callback,
             {
@@ -236,7 +252,7 @@ async def job_worker_loop(
                 "prompt_preview": prompt_preview,
                 "progress": 45.0,
                 "assigned_at": claimed_at,
-                "updated_at": datetime.now().isoformat(),
+                "updated_at": _now_iso(),
             },
         )
         await _emit_runtime_heartbeat(
@@ -275,12 +291,14 @@ async def job_worker_loop(
                         job=job,
                         options=options,
                         model_name=selected_model,
+                        mode=task_mode,
                     )
             else:
                 response = await _run_local_inference(
                     job=job,
                     options=options,
                     model_name=selected_model,
+                    mode=task_mode,
                 )
 
             output = response.get("response", "")
@@ -295,7 +313,7 @@ async def job_worker_loop(
             if job.assignment_hash_key:
                 result_payload["assignment_hash_key"] = job.assignment_hash_key
 
-            submitted = await client.submit_result(result_endpoint_template.format(job_id=job.id), result_payload)
+            submitted = await client.submit_result(result_prefix + job.id + result_suffix, result_payload)
             if not submitted:
                 raise RuntimeError("result_submit_rejected")
 
@@ -312,10 +330,10 @@ async def job_worker_loop(
                     "mode": task_mode,
                     "model": selected_model,
                     "prompt_preview": prompt_preview,
-                    "result_preview": str(output).strip().replace("\n", " ")[:240],
+                    "result_preview": preview(str(output)),
                     "progress": 100.0,
                     "latency_ms": elapsed_ms,
-                    "updated_at": datetime.now().isoformat(),
+                    "updated_at": _now_iso(),
                 },
             )
         except Exception as exc:  # noqa: BLE001
@@ -325,7 +343,7 @@ async def job_worker_loop(
             failure_payload = {"job_id": job.id, "error": message}
             if job.assignment_hash_key:
                 failure_payload["assignment_hash_key"] = job.assignment_hash_key
-            await client.submit_failure(fail_endpoint_template.format(job_id=job.id), failure_payload)
+            await client.submit_failure(fail_prefix + job.id + fail_suffix, failure_payload)
             trust.record_failure()
             _emit_task_event(
                 event_callback,
@@ -338,7 +356,7 @@ async def job_worker_loop(
                     "prompt_preview": prompt_preview,
                     "error": str(exc),
                     "progress": 100.0,
-                    "updated_at": datetime.now().isoformat(),
+                    "updated_at": _now_iso(),
                 },
             )
         finally:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+import queue
 
 
 DEFAULT_LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
@@ -27,7 +29,13 @@ def setup_logging(log_dir: Path, level: str = "INFO") -> logging.Logger:
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(logging.Formatter(DEFAULT_LOG_FORMAT))
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Records are formatted and written on the listener thread, so a warning logged from the
+    # agent loop is a queue put rather than a disk write.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
     logger.propagate = False
     return logger
@@ -1,17 +1,48 @@
 ﻿from __future__ import annotations
 
 from dataclasses import dataclass, field
+import re
 from typing import Any
 
+TASK_MODES = frozenset({"train", "finetune", "inference", "evaluation"})
+_WORKLOAD_MODE_RE = re.compile(r"workload_mode:\s*(\S*)", re.IGNORECASE)
+_NEWLINES_TO_SPACES = str.maketrans({"\n": " ", "\r": " "})
 
-@dataclass
+
+def detect_task_mode(configured_mode: Any, prompt: str) -> str:
+    mode = str(configured_mode or "").strip().lower()
+    if mode in TASK_MODES:
+        return mode
+
+    # Scan the prompt in place rather than lowering a copy of it.
+    match = _WORKLOAD_MODE_RE.search(prompt)
+    if match:
+        candidate = match.group(1).lower()
+        if candidate in TASK_MODES:
+            return candidate
+
+    return "inference"
+
+
+def preview(text: str, limit: int = 240) -> str:
+    # Same as text.strip()[:limit] with line breaks turned into spaces, but only the kept window
+    # is copied and rewritten; prompts and outputs can be megabytes.
+    start, end = 0, len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return text[start : min(end, start + limit)].translate(_NEWLINES_TO_SPACES)
+
+
+@dataclass(slots=True)
 class GPUInfo:
     name: str
     vram_total_gb: float
     vram_used_gb: float
 
 
-@dataclass
+@dataclass(slots=True)
 class JobPayload:
     id: str
     prompt: str
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import atexit
+import ctypes
+import sys
+import threading
+
+# In-process NVML bindings for the per-heartbeat VRAM query; nvidia-smi costs a fork+exec
+# and a CSV parse for the same three numbers.
+NVML_SUCCESS = 0
+
+if sys.platform == "win32":
+    _LIBRARY_NAMES = ("nvml.dll", r"C:\Program Files\NVIDIA Corporation\NVSMI\nvml.dll")
+else:
+    _LIBRARY_NAMES = ("libnvidia-ml.so.1", "libnvidia-ml.so")
+
+
+class NvmlMemory(ctypes.Structure):
+    _fields_ = [
+        ("total", ctypes.c_ulonglong),
+        ("free", ctypes.c_ulonglong),
+        ("used", ctypes.c_ulonglong),
+    ]
+
+
+_lock = threading.Lock()
+_lib: ctypes.CDLL | None = None
+_device: ctypes.c_void_p | None = None
+_init_attempted = False
+
+
+def _load_library() -> ctypes.CDLL | None:
+    for name in _LIBRARY_NAMES:
+        try:
+            return ctypes.CDLL(name)
+        except OSError:
+            continue
+    return None
+
+
+def _shutdown() -> None:
+    if _lib is not None:
+        try:
+            _lib.nvmlShutdown()
+        except Exception:
+            pass
+
+
+def _init() -> ctypes.c_void_p | None:
+    # Attempted once per process: hosts without the driver should not retry the dlopen per heartbeat.
+    global _lib, _device, _init_attempted
+    with _lock:
+        if _init_attempted:
+            return _device
+        _init_attempted = True
+
+        lib = _load_library()
+        if lib is None:
+            return None
+        try:
+            if lib.nvmlInit_v2() != NVML_SUCCESS:
+                return None
+            device = ctypes.c_void_p()
+            if lib.nvmlDeviceGetHandleByIndex_v2(ctypes.c_uint(0), ctypes.byref(device)) != NVML_SUCCESS:
+                lib.nvmlShutdown()
+                return None
+        except (AttributeError, OSError):
+            return None
+
+        _lib = lib
+        _device = device
+        atexit.register(_shutdown)
+        return _device
+
+
+def memory_info() -> NvmlMemory | None:
+    device = _init()
+    if device is None:
+        return None
+    memory = NvmlMemory()
+    try:
+        if _lib.nvmlDeviceGetMemoryInfo(device, ctypes.byref(memory)) != NVML_SUCCESS:
+            return None
+    except OSError:
+        return None
+    return memory
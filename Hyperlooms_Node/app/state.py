@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     connected: bool = False
     registered: bool = False
@@ -43,6 +43,12 @@ class AgentState:
     services_started_at: datetime | None = None
     runtime_started_at: datetime | None = None
     model_cache: list[str] = field(default_factory=list)
+    # Lowercased mirror of model_cache for case-insensitive membership checks; keep in sync via set_model_cache.
+    model_cache_lc: set[str] = field(default_factory=set)
 
     def touch(self) -> None:
         self.last_updated = datetime.now()
+
+    def set_model_cache(self, models: list[str]) -> None:
+        self.model_cache = models
+        self.model_cache_lc = {item.lower() for item in models}
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-import json
+import atexit
+import os
 from pathlib import Path
+import threading
+
+from app.json_codec import dumps_pretty, loads as json_loads
+
+SAVE_DEBOUNCE_SEC = 1.0
 
 
 class TrustManager:
     def __init__(self, path: Path, default_score: float = 0.9) -> None:
         self._path = path
         self._score = default_score
+        # Score changes are persisted at most once per debounce window, off the worker loop.
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._timer: threading.Timer | None = None
         self.load()
+        atexit.register(self.flush)
 
     @property
     def score(self) -> float:
@@ -28,13 +39,37 @@ class TrustManager:
         if not self._path.exists():
             return
         try:
-            data = json.loads(self._path.read_text(encoding="utf-8"))
+            data = json_loads(self._path.read_bytes())
             if isinstance(data, dict) and "score" in data:
                 self._score = float(data["score"])
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:
             return
 
     def save(self) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"score": round(self._score, 4)}
-        self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        with self._lock:
+            self._dirty = True
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(SAVE_DEBOUNCE_SEC, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def close(self) -> None:
+        # Flush now and drop the exit hook, which would otherwise keep this instance alive until exit.
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            payload = {"score": round(self._score, 4)}
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a crash mid-write never leaves a truncated trust file.
+            tmp_path = self._path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(dumps_pretty(payload))
+            os.replace(tmp_path, self._path)
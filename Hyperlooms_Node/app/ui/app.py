@@ -1,29 +1,138 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
+import os
 from pathlib import Path
-import queue
+import re
+import threading
 import time
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import font as tkfont, messagebox, ttk
+from typing import BinaryIO, Callable
 
 import psutil
 
 from app.agent import AgentController
 from app.config import AgentConfig, get_log_dir, load_config, save_config
+from app.device_probe import format_debug_trace, format_snapshot
+from app.event_queue import EventQueue
 from app.logger import setup_logging
 from app.state import AgentState
 
 
-def _tail_file(path: Path, max_lines: int = 400) -> str:
-    if not path.exists():
-        return ""
-    try:
-        lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    except OSError:
-        return ""
-    return "\n".join(lines[-max_lines:])
+class LogTailer:
+    """Keeps the last max_lines lines of a growing log, reading only what was appended."""
+
+    # On (re)open, or when far behind, the file is read backwards in chunks until max_lines lines
+    # are covered; older lines would fall out of the ring anyway.
+    READ_CHUNK_BYTES = 8192
+    CATCH_UP_BYTES_PER_LINE = 512
+
+    def __init__(self, path: Path, max_lines: int = 400) -> None:
+        self._path = path
+        self._max_lines = max_lines
+        self._ring: deque[str] = deque(maxlen=max_lines)
+        # Complete lines not yet handed out by take_updates(); a trailing partial line waits for its newline.
+        self._pending: deque[str] = deque(maxlen=max_lines)
+        self._rebuild = True
+        self._partial = b""
+        self._offset = 0
+        self._inode: int | None = None
+
+    def refresh(self) -> None:
+        try:
+            st = os.stat(self._path)
+        except OSError:
+            if self._inode is not None:
+                self._reset(None)
+            return
+
+        # New file, rotated/truncated, or so far behind that replaying the backlog costs more than
+        # rereading the tail: start over from the end.
+        restart = (
+            st.st_ino != self._inode
+            or st.st_size < self._offset
+            or st.st_size - self._offset > self._max_lines * self.CATCH_UP_BYTES_PER_LINE
+        )
+        if restart:
+            self._reset(st.st_ino)
+        if st.st_size <= self._offset:
+            return
+
+        # Opened per refresh: a handle held open would block RotatingFileHandler's rename on Windows.
+        try:
+            with open(self._path, "rb") as handle:
+                if restart:
+                    start, data = self._read_tail(handle, st.st_size)
+                else:
+                    start = self._offset
+                    handle.seek(start)
+                    data = handle.read(st.st_size - start)
+        except OSError:
+            return
+        if not data:
+            return
+
+        chunks = (self._partial + data).split(b"\n")
+        if start > 0 and self._offset == 0 and not self._partial:
+            # Began mid-file, so the first chunk is the tail of a line we never saw.
+            chunks = chunks[1:] or [b""]
+        self._partial = chunks.pop()
+        lines = [chunk.decode("utf-8", errors="ignore").rstrip("\r") for chunk in chunks]
+        self._ring.extend(lines)
+        self._pending.extend(lines)
+        self._offset = start + len(data)
+
+    def _read_tail(self, handle: BinaryIO, size: int) -> tuple[int, bytes]:
+        # One newline more than max_lines marks where the first wanted line starts. A file of
+        # very long lines stops at max_lines chunks.
+        chunks: list[bytes] = []
+        start = size
+        newlines = 0
+        limit = max(0, size - self._max_lines * self.READ_CHUNK_BYTES)
+        while start > limit and newlines <= self._max_lines:
+            step = min(self.READ_CHUNK_BYTES, start - limit)
+            start -= step
+            handle.seek(start)
+            chunk = handle.read(step)
+            newlines += chunk.count(b"\n")
+            chunks.append(chunk)
+        chunks.reverse()
+        return start, b"".join(chunks)
+
+    def take_updates(self) -> tuple[bool, list[str]]:
+        """Returns (rebuild, lines): the full tail after a reset, otherwise just the new lines."""
+        if self._rebuild:
+            rebuild, lines = True, list(self._ring)
+        else:
+            rebuild, lines = False, list(self._pending)
+        self._rebuild = False
+        self._pending.clear()
+        return rebuild, lines
+
+    def _reset(self, inode: int | None) -> None:
+        self._ring.clear()
+        self._pending.clear()
+        self._rebuild = True
+        self._partial = b""
+        self._offset = 0
+        self._inode = inode
+
+
+# Checked in order, so a line mentioning both "registered" and "failed" is still an error. One
+# alternation would report whichever keyword comes first in the line instead.
+_CONSOLE_TAG_PATTERNS = tuple(
+    (tag, re.compile(keywords, re.IGNORECASE | re.ASCII))
+    for tag, keywords in (
+        ("error", "failed|error"),
+        ("ok", "status_update|registered|completed"),
+        ("telemetry", "telemetry"),
+        ("warn", "ineligible|warning"),
+    )
+)
 
 
 def _safe_pct(used: float, total: float) -> float:
@@ -66,6 +175,27 @@ class NodeAgentUI(tk.Tk):
         "nav_bg_active": "#131B2A",
     }
 
+    # Named Tk fonts, created once in _init_style; widgets and styles refer to them by name so Tk
+    # does not resolve a font tuple for every widget.
+    FONTS = {
+        "HL.Sans8B": ("Segoe UI", 8, "bold"),
+        "HL.Sans9B": ("Segoe UI", 9, "bold"),
+        "HL.Sans9": ("Segoe UI", 9, "normal"),
+        "HL.Sans10B": ("Segoe UI", 10, "bold"),
+        "HL.Sans10": ("Segoe UI", 10, "normal"),
+        "HL.Sans11B": ("Segoe UI", 11, "bold"),
+        "HL.Sans12": ("Segoe UI", 12, "normal"),
+        "HL.Sans20B": ("Segoe UI", 20, "bold"),
+        "HL.Mono8B": ("Consolas", 8, "bold"),
+        "HL.Mono9B": ("Consolas", 9, "bold"),
+        "HL.Mono10B": ("Consolas", 10, "bold"),
+        "HL.Mono10": ("Consolas", 10, "normal"),
+        "HL.Mono11": ("Consolas", 11, "normal"),
+        "HL.Mono12B": ("Consolas", 12, "bold"),
+        "HL.Mono12": ("Consolas", 12, "normal"),
+        "HL.Mono17B": ("Consolas", 17, "bold"),
+    }
+
     METRIC_ORDER = [
         ("coordinator", "Coordinator", "NET"),
         ("node_agent", "Node Agent", "AGT"),
@@ -77,6 +207,16 @@ class NodeAgentUI(tk.Tk):
         ("eligibility", "Eligibility", "ELG"),
     ]
 
+    LOG_MAX_LINES = 400
+    CONSOLE_MAX_LINES = 1200
+    EVENT_BURST_WINDOW_SEC = 0.01
+    EVENT_POLL_MS = 250
+    METRIC_LAYOUT_BREAKPOINTS = (880, 1280)
+    OPERATIONS_LAYOUT_BREAKPOINTS = (1160, 1560)
+    # A window drag emits a <Configure> per pixel; relayout once the size has settled for a moment.
+    LAYOUT_DEBOUNCE_MS = 40
+    WHEEL_HIT_TTL_SEC = 0.3
+
     def __init__(self) -> None:
         super().__init__()
         self.title("Hyperlooms Node Control Center")
@@ -84,16 +224,23 @@ class NodeAgentUI(tk.Tk):
 
         self._config: AgentConfig = load_config()
         self._state = AgentState()
-        self._events: queue.Queue = queue.Queue()
+        self._events = EventQueue()
         self._logger = setup_logging(get_log_dir(), "INFO")
         self._controller = AgentController(self._config, self._state, self._events, self._logger)
 
-        self._console_lines: list[str] = []
-        self._log_cache = ""
+        self._console_lines: deque[tuple[str, str]] = deque(maxlen=self.CONSOLE_MAX_LINES)
+        self._log_tailer = LogTailer(get_log_dir() / "node.log", max_lines=self.LOG_MAX_LINES)
+        self._log_text_hash: int | None = None
+        self._log_line_count = 0
+        self._console_line_count = 0
+        self._console_started = False
         self._last_net_sent = 0
         self._last_net_recv = 0
         self._last_net_ts = time.monotonic()
         self._net_initialized = False
+        self._var_values: dict[str, object] = {}
+        self._pending_device_details: dict | None = None
+        self._clock_second = -1
 
         self._metric_vars: dict[str, tk.StringVar] = {}
         self._metric_icon_labels: dict[str, tk.Label] = {}
@@ -101,6 +248,7 @@ class NodeAgentUI(tk.Tk):
         self._metric_strip: tk.Frame | None = None
         self._metric_cards: list[tk.Frame] = []
         self._metric_column_count = len(self.METRIC_ORDER)
+        self._metric_layout_after: str | None = None
 
         self._operations_board: ttk.Frame | None = None
         self._operations_left: ttk.Frame | None = None
@@ -108,6 +256,7 @@ class NodeAgentUI(tk.Tk):
         self._operations_right: ttk.Frame | None = None
         self._operations_activity: tk.Frame | None = None
         self._operations_layout_mode: str | None = None
+        self._operations_layout_after: str | None = None
         self._readiness_vars: dict[str, tk.StringVar] = {}
         self._readiness_value_labels: dict[str, tk.Label] = {}
         self._guided_start_btn: ttk.Button | None = None
@@ -116,6 +265,7 @@ class NodeAgentUI(tk.Tk):
         self._tasks_detail: tk.Text | None = None
         self._distributed_tasks: dict[str, dict] = {}
         self._distributed_task_order: list[str] = []
+        self._tasks_list_lines: list[str] = []
 
         self._apply_responsive_window()
 
@@ -123,27 +273,39 @@ class NodeAgentUI(tk.Tk):
         self._build_ui()
         self._install_global_mousewheel_support()
 
-        self.after(250, self._drain_events)
+        # Events wake Tk only when the agent actually posts something: a daemon thread blocks on
+        # the queue and hands each burst to the main loop via after_idle. A Tcl built without
+        # threads cannot take that cross-thread call, so there the main loop polls instead.
+        self._drain_done = threading.Event()
+        self._event_pump: threading.Thread | None = None
+        if self.tk.eval("info exists tcl_platform(threaded)") == "1":
+            self._event_pump = threading.Thread(target=self._pump_events, name="ui-event-pump", daemon=True)
+            self._event_pump.start()
+        else:
+            self.after(self.EVENT_POLL_MS, self._poll_events)
         self.after(500, self._refresh_status)
+        self._tick_clock()
         self.after(1200, self._refresh_logs)
 
         self._append_console("control_center_ready")
 
     def _apply_responsive_window(self) -> None:
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
+        target_width, target_height, min_width, min_height, pos_x, pos_y = self._compute_window_geometry(
+            self.winfo_screenwidth(), self.winfo_screenheight()
+        )
+        self.minsize(min_width, min_height)
+        self.geometry(f"{target_width}x{target_height}+{pos_x}+{pos_y}")
 
+    @staticmethod
+    def _compute_window_geometry(screen_width: int, screen_height: int) -> tuple[int, int, int, int, int, int]:
+        """Returns (width, height, min width, min height, x, y) for a window centred on the screen."""
         target_width = min(1560, max(1180, screen_width - 60))
         target_height = min(980, max(700, screen_height - 80))
-
         min_width = min(1280, max(980, screen_width - 180))
         min_height = min(860, max(620, screen_height - 180))
-
-        self.minsize(min_width, min_height)
-
         pos_x = max((screen_width - target_width) // 2, 0)
         pos_y = max((screen_height - target_height) // 2, 0)
-        self.geometry(f"{target_width}x{target_height}+{pos_x}+{pos_y}")
+        return target_width, target_height, min_width, min_height, pos_x, pos_y
 
     def _install_global_mousewheel_support(self) -> None:
         # Route mouse-wheel events to the closest scrollable widget under cursor,
@@ -151,6 +313,17 @@ class NodeAgentUI(tk.Tk):
         self.bind_all("<MouseWheel>", self._on_global_mousewheel, add="+")
         self.bind_all("<Button-4>", self._on_global_mousewheel, add="+")
         self.bind_all("<Button-5>", self._on_global_mousewheel, add="+")
+        # Widget path -> nearest scrollable ancestor (or None). Tk can reuse a destroyed widget's
+        # path, so any destroy drops the whole map; widgets are rarely destroyed here.
+        self._scroll_target_cache: dict[str, tk.Misc | None] = {}
+        self.bind_all("<Destroy>", self._on_widget_destroyed, add="+")
+        # (x_root, y_root, monotonic time, target) of the last wheel tick, reused while a spin of the
+        # wheel continues in place.
+        self._wheel_hit: tuple[int, int, float, tk.Misc | None] | None = None
+
+    def _on_widget_destroyed(self, _event: tk.Event) -> None:
+        self._scroll_target_cache.clear()
+        self._wheel_hit = None
 
     def _normalize_wheel_delta(self, event: tk.Event) -> int:
         delta = int(getattr(event, "delta", 0) or 0)
@@ -167,19 +340,39 @@ class NodeAgentUI(tk.Tk):
         return 0
 
     def _find_scroll_target(self, widget: tk.Misc | None) -> tk.Misc | None:
+        if widget is None:
+            return None
+        key = str(widget)
+        try:
+            return self._scroll_target_cache[key]
+        except KeyError:
+            pass
+
+        target = None
         current = widget
         while current is not None:
             if callable(getattr(current, "yview_scroll", None)):
-                return current
+                target = current
+                break
             current = getattr(current, "master", None)
-        return None
+        self._scroll_target_cache[key] = target
+        return target
 
     def _on_global_mousewheel(self, event: tk.Event) -> str | None:
         step = self._normalize_wheel_delta(event)
         if step == 0:
             return None
 
-        target = self._find_scroll_target(self.winfo_containing(event.x_root, event.y_root))
+        x, y = event.x_root, event.y_root
+        now = time.monotonic()
+        hit = self._wheel_hit
+        # Scrolling can move a different widget under a still pointer, so the hit only lives for
+        # the rest of the current spin rather than until the next <Motion>.
+        if hit is not None and abs(x - hit[0]) + abs(y - hit[1]) < 4 and now - hit[2] < self.WHEEL_HIT_TTL_SEC:
+            target = hit[3]
+        else:
+            target = self._find_scroll_target(self.winfo_containing(x, y))
+        self._wheel_hit = (x, y, now, target)
         if target is None:
             return None
 
@@ -190,6 +383,12 @@ class NodeAgentUI(tk.Tk):
         return "break"
 
     def _init_style(self) -> None:
+        # Kept referenced: a named font is deleted from Tk when its Font object is collected.
+        self._fonts = {
+            name: tkfont.Font(self, name=name, family=family, size=size, weight=weight)
+            for name, (family, size, weight) in self.FONTS.items()
+        }
+
         style = ttk.Style(self)
         if "clam" in style.theme_names():
             style.theme_use("clam")
@@ -208,13 +407,13 @@ class NodeAgentUI(tk.Tk):
             "Card.TLabelframe.Label",
             background=self.PALETTE["card"],
             foreground=self.PALETTE["muted"],
-            font=("Segoe UI", 10, "bold"),
+            font="HL.Sans10B",
         )
 
-        style.configure("Subtitle.TLabel", background=self.PALETTE["card"], foreground=self.PALETTE["muted"], font=("Segoe UI", 10))
-        style.configure("Section.TLabel", background=self.PALETTE["card"], foreground=self.PALETTE["muted"], font=("Segoe UI", 10, "bold"))
-        style.configure("Field.TLabel", background=self.PALETTE["card"], foreground=self.PALETTE["muted"], font=("Segoe UI", 9, "bold"))
-        style.configure("Value.TLabel", background=self.PALETTE["card"], foreground=self.PALETTE["title"], font=("Segoe UI", 11, "bold"))
+        style.configure("Subtitle.TLabel", background=self.PALETTE["card"], foreground=self.PALETTE["muted"], font="HL.Sans10")
+        style.configure("Section.TLabel", background=self.PALETTE["card"], foreground=self.PALETTE["muted"], font="HL.Sans10B")
+        style.configure("Field.TLabel", background=self.PALETTE["card"], foreground=self.PALETTE["muted"], font="HL.Sans9B")
+        style.configure("Value.TLabel", background=self.PALETTE["card"], foreground=self.PALETTE["title"], font="HL.Sans11B")
 
         style.configure("Main.TNotebook", background=self.PALETTE["nav_bg"], borderwidth=0)
         style.configure(
@@ -226,7 +425,7 @@ class NodeAgentUI(tk.Tk):
             darkcolor=self.PALETTE["nav_bg"],
             bordercolor=self.PALETTE["border"],
             padding=(26, 14),
-            font=("Segoe UI", 11, "bold"),
+            font="HL.Sans11B",
         )
         style.map(
             "Main.TNotebook.Tab",
@@ -251,56 +450,38 @@ class NodeAgentUI(tk.Tk):
             foreground=[("readonly", self.PALETTE["input_fg"]), ("disabled", self.PALETTE["muted"])],
         )
 
-        style.configure(
-            "ActionNeutral.TButton",
-            padding=(14, 9),
-            font=("Segoe UI", 10, "bold"),
-            background=self.PALETTE["chip_bg"],
-            foreground=self.PALETTE["chip_fg"],
-            borderwidth=1,
-        )
-        style.map(
-            "ActionNeutral.TButton",
-            background=[("active", self.PALETTE["dark_button"]), ("disabled", "#1E2636")],
-            foreground=[("disabled", "#6D7A91")],
-        )
-
-        style.configure("ActionPrimary.TButton", padding=(14, 9), font=("Segoe UI", 10, "bold"), background=self.PALETTE["primary"], foreground="#ffffff", borderwidth=0)
-        style.map("ActionPrimary.TButton", background=[("active", self.PALETTE["primary_dark"]), ("disabled", "#6D2F2A")], foreground=[("disabled", "#FAD0CA")])
-
-        style.configure("ActionDanger.TButton", padding=(14, 9), font=("Segoe UI", 10, "bold"), background=self.PALETTE["danger"], foreground="#ffffff", borderwidth=0)
-        style.map("ActionDanger.TButton", background=[("active", self.PALETTE["danger_dark"]), ("disabled", "#6A3135")], foreground=[("disabled", "#FFD7DA")])
-
-        style.configure("ActionDark.TButton", padding=(14, 9), font=("Segoe UI", 10, "bold"), background=self.PALETTE["dark_button"], foreground="#ffffff", borderwidth=0)
-        style.map("ActionDark.TButton", background=[("active", self.PALETTE["dark_button_hover"]), ("disabled", "#556176")], foreground=[("disabled", "#D2DBEA")])
-
-        style.configure("ActionIndigo.TButton", padding=(14, 9), font=("Segoe UI", 10, "bold"), background=self.PALETTE["indigo"], foreground="#ffffff", borderwidth=0)
-        style.map("ActionIndigo.TButton", background=[("active", self.PALETTE["indigo_dark"]), ("disabled", "#70422D")], foreground=[("disabled", "#FFE1D2")])
+        palette = self.PALETTE
+        # (style, background, foreground, border, active background, disabled background, disabled foreground)
+        for name, bg, fg, border, active_bg, disabled_bg, disabled_fg in (
+            ("ActionNeutral", palette["chip_bg"], palette["chip_fg"], 1, palette["dark_button"], "#1E2636", "#6D7A91"),
+            ("ActionPrimary", palette["primary"], "#ffffff", 0, palette["primary_dark"], "#6D2F2A", "#FAD0CA"),
+            ("ActionDanger", palette["danger"], "#ffffff", 0, palette["danger_dark"], "#6A3135", "#FFD7DA"),
+            ("ActionDark", palette["dark_button"], "#ffffff", 0, palette["dark_button_hover"], "#556176", "#D2DBEA"),
+            ("ActionIndigo", palette["indigo"], "#ffffff", 0, palette["indigo_dark"], "#70422D", "#FFE1D2"),
+        ):
+            style.configure(
+                f"{name}.TButton",
+                padding=(14, 9),
+                font="HL.Sans10B",
+                background=bg,
+                foreground=fg,
+                borderwidth=border,
+            )
+            style.map(
+                f"{name}.TButton",
+                background=[("active", active_bg), ("disabled", disabled_bg)],
+                foreground=[("disabled", disabled_fg)],
+            )
 
-        style.configure(
-            "Ram.Horizontal.TProgressbar",
-            troughcolor=self.PALETTE["chip_bg"],
-            background=self.PALETTE["status_ok"],
-            lightcolor=self.PALETTE["status_ok"],
-            darkcolor=self.PALETTE["status_ok"],
-            thickness=10,
-        )
-        style.configure(
-            "Vram.Horizontal.TProgressbar",
-            troughcolor=self.PALETTE["chip_bg"],
-            background=self.PALETTE["status_info"],
-            lightcolor=self.PALETTE["status_info"],
-            darkcolor=self.PALETTE["status_info"],
-            thickness=10,
-        )
-        style.configure(
-            "Disk.Horizontal.TProgressbar",
-            troughcolor=self.PALETTE["chip_bg"],
-            background=self.PALETTE["status_warn"],
-            lightcolor=self.PALETTE["status_warn"],
-            darkcolor=self.PALETTE["status_warn"],
-            thickness=10,
-        )
+        for name, color in (("Ram", palette["status_ok"]), ("Vram", palette["status_info"]), ("Disk", palette["status_warn"])):
+            style.configure(
+                f"{name}.Horizontal.TProgressbar",
+                troughcolor=palette["chip_bg"],
+                background=color,
+                lightcolor=color,
+                darkcolor=color,
+                thickness=10,
+            )
 
     def _create_scrollable_tab(self, tab: ttk.Frame) -> ttk.Frame:
         container = tk.Frame(tab, bg=self.PALETTE["bg"], highlightthickness=0, bd=0)
@@ -328,6 +509,24 @@ class NodeAgentUI(tk.Tk):
         canvas.bind("<Configure>", _sync_width)
         return content
 
+    def _schedule_metric_layout(self, *_: object) -> None:
+        if self._metric_layout_after is not None:
+            self.after_cancel(self._metric_layout_after)
+        self._metric_layout_after = self.after(self.LAYOUT_DEBOUNCE_MS, self._run_metric_layout)
+
+    def _run_metric_layout(self) -> None:
+        self._metric_layout_after = None
+        self._refresh_metric_layout()
+
+    def _schedule_operations_layout(self, *_: object) -> None:
+        if self._operations_layout_after is not None:
+            self.after_cancel(self._operations_layout_after)
+        self._operations_layout_after = self.after(self.LAYOUT_DEBOUNCE_MS, self._run_operations_layout)
+
+    def _run_operations_layout(self) -> None:
+        self._operations_layout_after = None
+        self._refresh_operations_layout()
+
     def _refresh_metric_layout(self, *_: object) -> None:
         if self._metric_strip is None:
             return
@@ -337,13 +536,7 @@ class NodeAgentUI(tk.Tk):
             self.after(80, self._refresh_metric_layout)
             return
 
-        if width >= 1280:
-            columns = len(self.METRIC_ORDER)
-        elif width >= 880:
-            columns = 4
-        else:
-            columns = 2
-
+        columns = (2, 4, len(self.METRIC_ORDER))[bisect_right(self.METRIC_LAYOUT_BREAKPOINTS, width)]
         if columns == self._metric_column_count:
             return
 
@@ -381,12 +574,7 @@ class NodeAgentUI(tk.Tk):
             self.after(80, self._refresh_operations_layout)
             return
 
-        if width < 1160:
-            mode = "stacked"
-        elif width < 1560:
-            mode = "double"
-        else:
-            mode = "wide"
+        mode = ("stacked", "double", "wide")[bisect_right(self.OPERATIONS_LAYOUT_BREAKPOINTS, width)]
         if mode == self._operations_layout_mode:
             return
 
@@ -443,9 +631,28 @@ class NodeAgentUI(tk.Tk):
         self._notebook.pack(fill="both", expand=True, pady=(14, 0))
 
         self._build_operations_tab()
-        self._build_hardware_tab()
-        self._build_settings_tab()
-        self._build_logs_tab()
+        # The other tabs start as empty frames and get their widgets the first time they are shown.
+        self._tab_builders: dict[int, Callable[[ttk.Frame], None]] = {}
+        for text, builder in (
+            ("Hardware", self._build_hardware_tab),
+            ("Settings", self._build_settings_tab),
+            ("Logs", self._build_logs_tab),
+        ):
+            tab = ttk.Frame(self._notebook, style="App.TFrame")
+            self._notebook.add(tab, text=text)
+            self._tab_builders[self._notebook.index(tab)] = builder
+            if builder == self._build_logs_tab:
+                self._logs_tab_index = self._notebook.index(tab)
+        self._notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, _event: tk.Event | None = None) -> None:
+        index = self._notebook.index("current")
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder(self.nametowidget(self._notebook.select()))
+        if index == self._logs_tab_index:
+            self._update_log_view()
+
     def _build_header(self, parent: ttk.Frame) -> None:
         header = tk.Frame(parent, bg=self.PALETTE["card"], highlightthickness=1, highlightbackground=self.PALETTE["border"], bd=0)
         header.pack(fill="x")
@@ -453,19 +660,19 @@ class NodeAgentUI(tk.Tk):
         left = tk.Frame(header, bg=self.PALETTE["card"])
         left.pack(side="left", fill="x", expand=True, padx=24, pady=16)
 
-        tk.Label(left, text="Hyperlooms Node", bg=self.PALETTE["card"], fg=self.PALETTE["title"], font=("Segoe UI", 20, "bold")).pack(anchor="w")
+        tk.Label(left, text="Hyperlooms Node", bg=self.PALETTE["card"], fg=self.PALETTE["title"], font="HL.Sans20B").pack(anchor="w")
         tk.Label(
             left,
             text="Enterprise Node Agent   |   AMD-style operations skin   |   local workload runtime",
             bg=self.PALETTE["card"],
             fg=self.PALETTE["muted"],
-            font=("Segoe UI", 12),
+            font="HL.Sans12",
         ).pack(anchor="w", pady=(4, 0))
 
         right = tk.Frame(header, bg=self.PALETTE["card"])
         right.pack(side="right", padx=20, pady=16)
 
-        self._clock_label = tk.Label(right, text="--:--:--", bg=self.PALETTE["card"], fg=self.PALETTE["muted"], font=("Consolas", 12, "bold"))
+        self._clock_label = tk.Label(right, text="--:--:--", bg=self.PALETTE["card"], fg=self.PALETTE["muted"], font="HL.Mono12B")
         self._clock_label.pack(anchor="e")
 
         self._overall_badge = tk.Label(
@@ -475,7 +682,7 @@ class NodeAgentUI(tk.Tk):
             fg=self.PALETTE["badge_off_fg"],
             padx=16,
             pady=8,
-            font=("Segoe UI", 11, "bold"),
+            font="HL.Sans11B",
             highlightthickness=1,
             highlightbackground=self.PALETTE["status_error"],
         )
@@ -502,7 +709,7 @@ class NodeAgentUI(tk.Tk):
             card = tk.Frame(strip, bg=self.PALETTE["card"], highlightthickness=1, highlightbackground=self.PALETTE["border"], bd=0, padx=14, pady=12)
             card.grid(row=0, column=index, sticky="nsew", padx=(0 if index == 0 else 8, 0))
 
-            tk.Label(card, text=title.upper(), bg=self.PALETTE["card"], fg=self.PALETTE["muted"], font=("Segoe UI", 8, "bold")).pack(anchor="w")
+            tk.Label(card, text=title.upper(), bg=self.PALETTE["card"], fg=self.PALETTE["muted"], font="HL.Sans8B").pack(anchor="w")
 
             value_row = tk.Frame(card, bg=self.PALETTE["card"])
             value_row.pack(anchor="w", pady=(8, 0), fill="x")
@@ -512,13 +719,13 @@ class NodeAgentUI(tk.Tk):
                 text=icon,
                 bg=self.PALETTE["chip_bg"],
                 fg=self.PALETTE["chip_fg"],
-                font=("Consolas", 8, "bold"),
+                font="HL.Mono8B",
                 padx=6,
                 pady=2,
             )
             icon_label.pack(side="left")
 
-            value_label = tk.Label(value_row, textvariable=self._metric_vars[key], bg=self.PALETTE["card"], fg=self.PALETTE["title"], font=("Segoe UI", 11, "bold"), padx=8)
+            value_label = tk.Label(value_row, textvariable=self._metric_vars[key], bg=self.PALETTE["card"], fg=self.PALETTE["title"], font="HL.Sans11B", padx=8)
             value_label.pack(side="left")
 
             self._metric_cards.append(card)
@@ -526,12 +733,20 @@ class NodeAgentUI(tk.Tk):
             self._metric_value_labels[key] = value_label
             strip.columnconfigure(index, weight=1)
 
-        strip.bind("<Configure>", self._refresh_metric_layout)
+        # Refresh-path view of the cards, in METRIC_ORDER: (key, var, value label, icon label).
+        self._metric_fast = [
+            (key, self._metric_vars[key], self._metric_value_labels[key], self._metric_icon_labels[key])
+            for key, _, _ in self.METRIC_ORDER
+        ]
+        self._metric_tone_cache: list[str | None] = [None] * len(self._metric_fast)
+
+        strip.bind("<Configure>", self._schedule_metric_layout)
         self.after(0, self._refresh_metric_layout)
 
     def _build_operations_tab(self) -> None:
         tab = ttk.Frame(self._notebook, style="App.TFrame")
         self._notebook.add(tab, text="Operations")
+        self._operations_tab_index = self._notebook.index(tab)
 
         tab_content = self._create_scrollable_tab(tab)
 
@@ -570,7 +785,7 @@ class NodeAgentUI(tk.Tk):
         self._operations_mid = onboarding_col
         self._operations_right = telemetry_col
         self._operations_activity = activity_panel
-        board.bind("<Configure>", self._refresh_operations_layout)
+        board.bind("<Configure>", self._schedule_operations_layout)
         self.after(0, self._refresh_operations_layout)
 
     def _build_controls_card(self, parent: ttk.Frame) -> None:
@@ -620,7 +835,7 @@ class NodeAgentUI(tk.Tk):
             text="RUN READINESS",
             bg=self.PALETTE["chip_bg"],
             fg=self.PALETTE["chip_fg"],
-            font=("Segoe UI", 9, "bold"),
+            font="HL.Sans9B",
         ).pack(anchor="w", pady=(0, 6))
 
         self._readiness_vars = {
@@ -649,14 +864,14 @@ class NodeAgentUI(tk.Tk):
                 text=f"{title}:",
                 bg=self.PALETTE["chip_bg"],
                 fg=self.PALETTE["muted"],
-                font=("Segoe UI", 9, "bold"),
+                font="HL.Sans9B",
             ).pack(side="left")
             value_label = tk.Label(
                 row,
                 textvariable=self._readiness_vars[key],
                 bg=self.PALETTE["chip_bg"],
                 fg=self.PALETTE["muted"],
-                font=("Segoe UI", 9),
+                font="HL.Sans9",
             )
             value_label.pack(side="right")
             self._readiness_value_labels[key] = value_label
@@ -717,7 +932,7 @@ class NodeAgentUI(tk.Tk):
             fg=self.PALETTE["chip_fg"],
             padx=8,
             pady=3,
-            font=("Segoe UI", 9, "bold"),
+            font="HL.Sans9B",
         )
         self._job_badge.grid(row=0, column=1, sticky="e")
 
@@ -751,13 +966,13 @@ class NodeAgentUI(tk.Tk):
             pady=12,
         )
         up_card.grid(row=0, column=0, sticky="ew", padx=(0, 8))
-        tk.Label(up_card, text="NETWORK UP", bg=self.PALETTE["card"], fg=self.PALETTE["muted"], font=("Segoe UI", 8, "bold")).pack(anchor="center")
+        tk.Label(up_card, text="NETWORK UP", bg=self.PALETTE["card"], fg=self.PALETTE["muted"], font="HL.Sans8B").pack(anchor="center")
         tk.Label(
             up_card,
             textvariable=self._telemetry_labels["net_up"],
             bg=self.PALETTE["card"],
             fg=self.PALETTE["status_ok"],
-            font=("Consolas", 17, "bold"),
+            font="HL.Mono17B",
         ).pack(anchor="center", pady=(4, 0))
 
         down_card = tk.Frame(
@@ -769,13 +984,13 @@ class NodeAgentUI(tk.Tk):
             pady=12,
         )
         down_card.grid(row=0, column=1, sticky="ew", padx=(8, 0))
-        tk.Label(down_card, text="NETWORK DOWN", bg=self.PALETTE["card"], fg=self.PALETTE["muted"], font=("Segoe UI", 8, "bold")).pack(anchor="center")
+        tk.Label(down_card, text="NETWORK DOWN", bg=self.PALETTE["card"], fg=self.PALETTE["muted"], font="HL.Sans8B").pack(anchor="center")
         tk.Label(
             down_card,
             textvariable=self._telemetry_labels["net_down"],
             bg=self.PALETTE["card"],
             fg=self.PALETTE["status_info"],
-            font=("Consolas", 17, "bold"),
+            font="HL.Mono17B",
         ).pack(anchor="center", pady=(4, 0))
 
     def _build_distributed_tasks_card(self, parent: ttk.Frame) -> None:
@@ -808,7 +1023,7 @@ class NodeAgentUI(tk.Tk):
 
         self._tasks_list = tk.Listbox(
             list_wrap,
-            font=("Consolas", 10),
+            font="HL.Mono10",
             bg=self.PALETTE["terminal_bg"],
             fg=self.PALETTE["terminal_text"],
             selectbackground="#243147",
@@ -834,7 +1049,7 @@ class NodeAgentUI(tk.Tk):
             detail_wrap,
             height=6,
             wrap="word",
-            font=("Consolas", 10),
+            font="HL.Mono10",
             bg=self.PALETTE["input_bg"],
             fg=self.PALETTE["terminal_text"],
             insertbackground=self.PALETTE["status_ok"],
@@ -875,12 +1090,12 @@ class NodeAgentUI(tk.Tk):
 
         circles = tk.Frame(head, bg=self.PALETTE["terminal_head"])
         circles.pack(side="left", padx=10)
-        tk.Label(circles, text="o", fg=self.PALETTE["status_error"], bg=self.PALETTE["terminal_head"], font=("Consolas", 10, "bold")).pack(side="left", padx=2)
-        tk.Label(circles, text="o", fg=self.PALETTE["status_warn"], bg=self.PALETTE["terminal_head"], font=("Consolas", 10, "bold")).pack(side="left", padx=2)
-        tk.Label(circles, text="o", fg=self.PALETTE["status_ok"], bg=self.PALETTE["terminal_head"], font=("Consolas", 10, "bold")).pack(side="left", padx=2)
+        tk.Label(circles, text="o", fg=self.PALETTE["status_error"], bg=self.PALETTE["terminal_head"], font="HL.Mono10B").pack(side="left", padx=2)
+        tk.Label(circles, text="o", fg=self.PALETTE["status_warn"], bg=self.PALETTE["terminal_head"], font="HL.Mono10B").pack(side="left", padx=2)
+        tk.Label(circles, text="o", fg=self.PALETTE["status_ok"], bg=self.PALETTE["terminal_head"], font="HL.Mono10B").pack(side="left", padx=2)
 
-        tk.Label(head, text="ACTIVITY STREAM", bg=self.PALETTE["terminal_head"], fg=self.PALETTE["chip_fg"], font=("Segoe UI", 10, "bold")).pack(side="left", padx=12)
-        tk.Label(head, text="SSH: LOCALHOST:22", bg=self.PALETTE["terminal_head"], fg=self.PALETTE["muted"], font=("Consolas", 9, "bold")).pack(side="right", padx=10)
+        tk.Label(head, text="ACTIVITY STREAM", bg=self.PALETTE["terminal_head"], fg=self.PALETTE["chip_fg"], font="HL.Sans10B").pack(side="left", padx=12)
+        tk.Label(head, text="SSH: LOCALHOST:22", bg=self.PALETTE["terminal_head"], fg=self.PALETTE["muted"], font="HL.Mono9B").pack(side="right", padx=10)
 
         content = tk.Frame(panel, bg=self.PALETTE["terminal_bg"])
         content.grid(row=1, column=0, sticky="nsew")
@@ -890,7 +1105,7 @@ class NodeAgentUI(tk.Tk):
         self._console = tk.Text(
             content,
             wrap="none",
-            font=("Consolas", 12),
+            font="HL.Mono12",
             bg=self.PALETTE["terminal_bg"],
             fg=self.PALETTE["terminal_text"],
             insertbackground=self.PALETTE["status_ok"],
@@ -912,10 +1127,7 @@ class NodeAgentUI(tk.Tk):
         self._console.tag_configure("cursor", foreground=self.PALETTE["status_ok"])
         return panel
 
-    def _build_hardware_tab(self) -> None:
-        tab = ttk.Frame(self._notebook, style="App.TFrame")
-        self._notebook.add(tab, text="Hardware")
-
+    def _build_hardware_tab(self, tab: ttk.Frame) -> None:
         controls = ttk.Frame(tab, style="App.TFrame")
         controls.pack(fill="x", padx=10, pady=8)
         ttk.Button(controls, text="Fetch Device Details", style="ActionDark.TButton", command=self._controller.fetch_device_details).pack(side="left", padx=4)
@@ -926,7 +1138,7 @@ class NodeAgentUI(tk.Tk):
         self._snapshot_text = tk.Text(
             snapshot_frame,
             wrap="none",
-            font=("Consolas", 11),
+            font="HL.Mono11",
             bg=self.PALETTE["card"],
             fg=self.PALETTE["title"],
             insertbackground=self.PALETTE["status_ok"],
@@ -941,7 +1153,7 @@ class NodeAgentUI(tk.Tk):
         self._debug_text = tk.Text(
             debug_frame,
             wrap="none",
-            font=("Consolas", 11),
+            font="HL.Mono11",
             bg=self.PALETTE["terminal_bg"],
             fg=self.PALETTE["terminal_text"],
             insertbackground=self.PALETTE["status_ok"],
@@ -951,6 +1163,10 @@ class NodeAgentUI(tk.Tk):
         dbg_scroll.pack(side="right", fill="y")
         self._debug_text.configure(yscrollcommand=dbg_scroll.set, state="disabled")
 
+        if self._pending_device_details is not None:
+            self._render_device_details(self._pending_device_details)
+            self._pending_device_details = None
+
     def _build_models_tab(self) -> None:
         tab = ttk.Frame(self._notebook, style="App.TFrame")
         self._notebook.add(tab, text="Models")
@@ -961,7 +1177,7 @@ class NodeAgentUI(tk.Tk):
         body = ttk.Frame(outer, style="CardBody.TFrame")
         body.pack(fill="both", expand=True)
 
-        self._models_list = tk.Listbox(body, height=14, font=("Segoe UI", 10), bd=0, highlightthickness=1, highlightbackground=self.PALETTE["border"])
+        self._models_list = tk.Listbox(body, height=14, font="HL.Sans10", bd=0, highlightthickness=1, highlightbackground=self.PALETTE["border"])
         self._models_list.pack(side="left", fill="both", expand=True, padx=10, pady=10)
 
         actions = ttk.Frame(body, style="CardBody.TFrame")
@@ -975,9 +1191,7 @@ class NodeAgentUI(tk.Tk):
 
         self._model_status = ttk.Label(actions, text="", style="Section.TLabel")
         self._model_status.pack(anchor="w", pady=8)
-    def _build_settings_tab(self) -> None:
-        tab = ttk.Frame(self._notebook, style="App.TFrame")
-        self._notebook.add(tab, text="Settings")
+    def _build_settings_tab(self, tab: ttk.Frame) -> None:
         tab_content = self._create_scrollable_tab(tab)
 
         self._settings_vars = {
@@ -1075,17 +1289,14 @@ class NodeAgentUI(tk.Tk):
         ttk.Button(actions, text="Save Settings", style="ActionPrimary.TButton", command=self._save_settings).pack(side="left", padx=4)
         ttk.Button(actions, text="Reload Settings", style="ActionDark.TButton", command=self._reload_config).pack(side="left", padx=4)
 
-    def _build_logs_tab(self) -> None:
-        tab = ttk.Frame(self._notebook, style="App.TFrame")
-        self._notebook.add(tab, text="Logs")
-
+    def _build_logs_tab(self, tab: ttk.Frame) -> None:
         frame = ttk.LabelFrame(tab, text="Node Agent Logs", style="Card.TLabelframe")
         frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         self._log_text = tk.Text(
             frame,
             wrap="none",
-            font=("Consolas", 10),
+            font="HL.Mono10",
             bg=self.PALETTE["terminal_bg"],
             fg=self.PALETTE["terminal_text"],
             insertbackground=self.PALETTE["status_ok"],
@@ -1096,34 +1307,67 @@ class NodeAgentUI(tk.Tk):
         self._log_text.configure(yscrollcommand=scroll.set, state="disabled")
 
     def _append_console(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self._console_lines.append(f"[{timestamp}] {message}")
-        self._console_lines = self._console_lines[-1200:]
-        self._render_console()
+        self._append_console_lines([message])
 
-    def _render_console(self) -> None:
+    def _append_console_lines(self, messages: list[str]) -> None:
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        # Each line is classified once, here; the history keeps the tag for replays.
+        lines = [(f"[{timestamp}] {message}", self._console_tag(message)) for message in messages]
+        self._console_lines.extend(lines)
+        self._write_console_lines(lines[-self.CONSOLE_MAX_LINES:])
+
+    @staticmethod
+    def _console_tag(line: str) -> str:
+        for tag, pattern in _CONSOLE_TAG_PATTERNS:
+            if pattern.search(line):
+                return tag
+        return "line"
+
+    def _write_console_lines(self, lines: list[tuple[str, str]]) -> None:
         if not hasattr(self, "_console"):
             return
 
-        self._console.configure(state="normal")
-        self._console.delete("1.0", tk.END)
-
-        for line in self._console_lines:
-            lower = line.lower()
-            tag = "line"
-            if "failed" in lower or "error" in lower:
-                tag = "error"
-            elif "status_update" in lower or "registered" in lower or "completed" in lower:
-                tag = "ok"
-            elif "telemetry" in lower:
-                tag = "telemetry"
-            elif "ineligible" in lower or "warning" in lower:
-                tag = "warn"
-            self._console.insert(tk.END, line + "\n", tag)
-
-        self._console.insert(tk.END, "_", "cursor")
-        self._console.see(tk.END)
-        self._console.configure(state="disabled")
+        if not self._console_started:
+            # First write: replay anything logged before the widget existed, then park the cursor glyph.
+            self._console_started = True
+            lines = list(self._console_lines)
+            self._console.configure(state="normal")
+            self._console.insert(tk.END, "_", "cursor")
+            self._console.configure(state="disabled")
+
+        # New lines go in just before the trailing "_" cursor glyph.
+        self._console_line_count = self._append_text_lines(
+            self._console,
+            "end-2c",
+            lines,
+            self._console_line_count,
+            self.CONSOLE_MAX_LINES,
+        )
+
+    @staticmethod
+    def _append_text_lines(
+        widget: tk.Text,
+        index: str,
+        lines: list[tuple[str, str | tuple]],
+        line_count: int,
+        max_lines: int,
+    ) -> int:
+        # Only the delta reaches Tk: one insert for the batch, then trim the oldest lines off the top.
+        if not lines:
+            return line_count
+        args: list[str | tuple] = []
+        for line, tag in lines:
+            args.append(line + "\n")
+            args.append(tag)
+        widget.configure(state="normal")
+        widget.insert(index, *args)
+        line_count += len(lines)
+        if line_count > max_lines:
+            widget.delete("1.0", f"{line_count - max_lines + 1}.0")
+            line_count = max_lines
+        widget.see(tk.END)
+        widget.configure(state="disabled")
+        return line_count
 
     def _start_guided_flow(self) -> None:
         if self._state.consent_status != "accepted":
@@ -1164,7 +1408,7 @@ class NodeAgentUI(tk.Tk):
         for key, (ready, detail) in statuses.items():
             if key not in self._readiness_vars:
                 continue
-            self._readiness_vars[key].set(f"{'READY' if ready else 'WAIT'} - {detail}")
+            self._set_var(self._readiness_vars[key], f"{'READY' if ready else 'WAIT'} - {detail}")
             label = self._readiness_value_labels.get(key)
             if label:
                 label.configure(fg=self.PALETTE["status_ok"] if ready else self.PALETTE["status_warn"])
@@ -1267,17 +1511,35 @@ class NodeAgentUI(tk.Tk):
         self._settings_vars["min_disk"].set(str(self._config.min_disk_gb))
 
     def _refresh_logs(self) -> None:
-        log_content = _tail_file(get_log_dir() / "node.log")
-        if log_content != self._log_cache:
-            self._log_cache = log_content
-            self._log_text.configure(state="normal")
-            self._log_text.delete("1.0", tk.END)
-            self._log_text.insert(tk.END, log_content)
-            self._log_text.see(tk.END)
-            self._log_text.configure(state="disabled")
-
+        # The file is not even stat'ed while the Logs tab is hidden; the tailer catches up from its
+        # offset when the tab is shown again.
+        if self._tab_selected(self._logs_tab_index):
+            self._update_log_view()
         self.after(1500, self._refresh_logs)
 
+    def _update_log_view(self) -> None:
+        if not hasattr(self, "_log_text"):
+            return
+        self._log_tailer.refresh()
+        rebuild, lines = self._log_tailer.take_updates()
+        if rebuild:
+            log_content = "".join(line + "\n" for line in lines)
+            # A rotation can reset the tailer while the visible tail stays the same; skip the Tk rebuild then.
+            content_hash = hash(log_content)
+            if content_hash != self._log_text_hash:
+                self._log_text_hash = content_hash
+                self._log_line_count = len(lines)
+                self._log_text.configure(state="normal")
+                self._log_text.delete("1.0", tk.END)
+                self._log_text.insert(tk.END, log_content)
+                self._log_text.see(tk.END)
+                self._log_text.configure(state="disabled")
+        elif lines:
+            self._log_text_hash = None
+            self._log_line_count = self._append_text_lines(
+                self._log_text, "end-1c", [(line, ()) for line in lines], self._log_line_count, self.LOG_MAX_LINES
+            )
+
     def _format_rate(self, bytes_per_sec: float) -> str:
         if bytes_per_sec < 1024:
             return f"{bytes_per_sec:.0f} B/s"
@@ -1287,12 +1549,31 @@ class NodeAgentUI(tk.Tk):
             return f"{bytes_per_sec / (1024 * 1024):.2f} MB/s"
         return f"{bytes_per_sec / (1024 * 1024 * 1024):.2f} GB/s"
 
+    def _set_var(self, var: tk.Variable, value: object) -> None:
+        # Every set() fires the variable's traces and redraws the widgets bound to it, so unchanged
+        # values are skipped. The last value is kept on the Python side; var.get() is a Tcl round trip.
+        name = str(var)
+        if self._var_values.get(name) != value:
+            self._var_values[name] = value
+            var.set(value)
+
+    def _set_progress(self, var: tk.DoubleVar, pct: float) -> None:
+        # A bar a few hundred pixels wide cannot show sub-0.1% moves.
+        self._set_var(var, round(pct, 1))
+
+    def _tab_selected(self, index: int) -> bool:
+        try:
+            return self._notebook.index("current") == index
+        except tk.TclError:
+            return False
+
     def _update_network_telemetry(self) -> None:
         try:
-            counters = psutil.net_io_counters()
+            # Totals only: per-NIC counters would build a namedtuple per interface each tick.
+            counters = psutil.net_io_counters(pernic=False, nowrap=True)
         except Exception:
-            self._telemetry_labels["net_up"].set("-")
-            self._telemetry_labels["net_down"].set("-")
+            self._set_var(self._telemetry_labels["net_up"], "-")
+            self._set_var(self._telemetry_labels["net_down"], "-")
             return
 
         now = time.monotonic()
@@ -1301,8 +1582,8 @@ class NodeAgentUI(tk.Tk):
             self._last_net_recv = counters.bytes_recv
             self._last_net_ts = now
             self._net_initialized = True
-            self._telemetry_labels["net_up"].set("0 KB/s")
-            self._telemetry_labels["net_down"].set("0 KB/s")
+            self._set_var(self._telemetry_labels["net_up"], "0 KB/s")
+            self._set_var(self._telemetry_labels["net_down"], "0 KB/s")
             return
 
         elapsed = max(now - self._last_net_ts, 1e-6)
@@ -1313,42 +1594,56 @@ class NodeAgentUI(tk.Tk):
         self._last_net_recv = counters.bytes_recv
         self._last_net_ts = now
 
-        self._telemetry_labels["net_up"].set(self._format_rate(up_rate))
-        self._telemetry_labels["net_down"].set(self._format_rate(down_rate))
+        self._set_var(self._telemetry_labels["net_up"], self._format_rate(up_rate))
+        self._set_var(self._telemetry_labels["net_down"], self._format_rate(down_rate))
 
     def _refresh_status(self) -> None:
         state = self._state
 
-        self._metric_vars["coordinator"].set(state.coordinator_status)
-        self._metric_vars["node_agent"].set(state.node_agent_status)
-        self._metric_vars["discovery"].set(state.discovery_status)
-        self._metric_vars["registration"].set(state.registration_status)
-        self._metric_vars["runtime"].set(state.runtime_status)
-        self._metric_vars["trust"].set(f"{state.trust_score:.2f}")
-        self._metric_vars["node_id"].set(state.node_id or "-")
-        self._metric_vars["eligibility"].set(state.eligibility_reason or "-")
+        # Same order as METRIC_ORDER.
+        self._refresh_metrics(
+            (
+                state.coordinator_status,
+                state.node_agent_status,
+                state.discovery_status,
+                state.registration_status,
+                state.runtime_status,
+                f"{state.trust_score:.2f}",
+                state.node_id or "-",
+                state.eligibility_reason or "-",
+            )
+        )
 
-        ram_used = max(0.0, state.ram_total_gb - state.ram_free_gb)
-        disk_used = max(0.0, state.disk_total_gb - state.disk_free_gb)
-        self._ram_progress.set(_safe_pct(ram_used, state.ram_total_gb))
-        self._vram_progress.set(_safe_pct(state.vram_used_gb, state.vram_total_gb))
-        self._disk_progress.set(_safe_pct(disk_used, state.disk_total_gb))
+        # The telemetry card lives on the Operations tab; skip sampling and redraws while it is hidden.
+        if self._tab_selected(self._operations_tab_index):
+            ram_used = max(0.0, state.ram_total_gb - state.ram_free_gb)
+            disk_used = max(0.0, state.disk_total_gb - state.disk_free_gb)
+            self._set_progress(self._ram_progress, _safe_pct(ram_used, state.ram_total_gb))
+            self._set_progress(self._vram_progress, _safe_pct(state.vram_used_gb, state.vram_total_gb))
+            self._set_progress(self._disk_progress, _safe_pct(disk_used, state.disk_total_gb))
 
-        self._telemetry_labels["ram"].set(f"{ram_used:.2f} / {state.ram_total_gb:.2f} GB")
-        self._telemetry_labels["vram"].set(f"{state.vram_used_gb:.2f} / {state.vram_total_gb:.2f} GB")
-        self._telemetry_labels["disk"].set(f"{disk_used:.2f} / {state.disk_total_gb:.2f} GB")
+            self._set_var(self._telemetry_labels["ram"], f"{ram_used:.2f} / {state.ram_total_gb:.2f} GB")
+            self._set_var(self._telemetry_labels["vram"], f"{state.vram_used_gb:.2f} / {state.vram_total_gb:.2f} GB")
+            self._set_var(self._telemetry_labels["disk"], f"{disk_used:.2f} / {state.disk_total_gb:.2f} GB")
 
-        self._update_network_telemetry()
+            self._update_network_telemetry()
 
         self._job_badge.configure(text=f"Current Job: {state.current_job_status or 'idle'}")
-        self._clock_label.configure(text=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
         self._refresh_badge()
         self._refresh_button_states()
-        self._refresh_metric_tones()
         self._refresh_readiness_panel()
         self.after(600, self._refresh_status)
 
+    def _tick_clock(self) -> None:
+        # Own timer, woken just past each second boundary, so the label changes exactly once per second.
+        now = time.time()
+        second = int(now)
+        if second != self._clock_second:
+            self._clock_second = second
+            self._clock_label.configure(text=datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S"))
+        self.after(int((second + 1 - now) * 1000) + 5, self._tick_clock)
+
     def _refresh_badge(self) -> None:
         if self._state.runtime_status == "running":
             self._overall_badge.configure(
@@ -1375,39 +1670,47 @@ class NodeAgentUI(tk.Tk):
             )
             self._job_badge.configure(bg=self.PALETTE["badge_off_bg"], fg=self.PALETTE["badge_off_fg"])
 
-    def _refresh_metric_tones(self) -> None:
-        for key, _, _ in self.METRIC_ORDER:
-            value = self._metric_vars[key].get().lower()
-            color = self.PALETTE["muted"]
-            if key == "coordinator":
-                color = self.PALETTE["status_ok"] if value == "ok" else self.PALETTE["status_error"]
-            elif key == "node_agent":
-                color = self.PALETTE["status_ok"] if value in {"ok", "starting"} else self.PALETTE["status_error"]
-            elif key == "discovery":
-                color = self.PALETTE["status_ok"] if value == "eligible" else (self.PALETTE["status_error"] if value == "ineligible" else self.PALETTE["muted"])
-            elif key == "registration":
-                color = self.PALETTE["status_ok"] if value in {"registered", "already_registered"} else self.PALETTE["status_error"]
-            elif key == "runtime":
-                color = (
-                    self.PALETTE["status_ok"]
-                    if value == "running"
-                    else (
-                        self.PALETTE["status_warn"]
-                        if value in {"starting", "stopping", "awaiting-registration"}
-                        else (self.PALETTE["status_error"] if value == "awaiting-services" else self.PALETTE["muted"])
-                    )
+    def _refresh_metrics(self, values: tuple[str, ...]) -> None:
+        for index, ((key, var, value_label, icon_label), value) in enumerate(zip(self._metric_fast, values)):
+            self._set_var(var, value)
+            color = self._metric_tone(key, value)
+            if color == self._metric_tone_cache[index]:
+                continue
+            self._metric_tone_cache[index] = color
+            icon_label.configure(fg=color)
+            value_label.configure(fg=color if key != "node_id" else self.PALETTE["title"])
+
+    def _metric_tone(self, key: str, raw_value: str) -> str:
+        value = raw_value.lower()
+        color = self.PALETTE["muted"]
+        if key == "coordinator":
+            color = self.PALETTE["status_ok"] if value == "ok" else self.PALETTE["status_error"]
+        elif key == "node_agent":
+            color = self.PALETTE["status_ok"] if value in {"ok", "starting"} else self.PALETTE["status_error"]
+        elif key == "discovery":
+            color = self.PALETTE["status_ok"] if value == "eligible" else (self.PALETTE["status_error"] if value == "ineligible" else self.PALETTE["muted"])
+        elif key == "registration":
+            color = self.PALETTE["status_ok"] if value in {"registered", "already_registered"} else self.PALETTE["status_error"]
+        elif key == "runtime":
+            color = (
+                self.PALETTE["status_ok"]
+                if value == "running"
+                else (
+                    self.PALETTE["status_warn"]
+                    if value in {"starting", "stopping", "awaiting-registration"}
+                    else (self.PALETTE["status_error"] if value == "awaiting-services" else self.PALETTE["muted"])
                 )
-            elif key == "trust":
-                try:
-                    trust = float(self._metric_vars[key].get())
-                except ValueError:
-                    trust = 0.0
-                color = self.PALETTE["status_ok"] if trust >= 0.85 else (self.PALETTE["status_warn"] if trust >= 0.6 else self.PALETTE["status_error"])
-            elif key == "eligibility":
-                color = self.PALETTE["status_ok"] if value in {"ok", "demo_mode"} else self.PALETTE["status_error"]
-
-            self._metric_icon_labels[key].configure(fg=color)
-            self._metric_value_labels[key].configure(fg=color if key != "node_id" else self.PALETTE["title"])
+            )
+        elif key == "trust":
+            try:
+                trust = float(raw_value)
+            except ValueError:
+                trust = 0.0
+            color = self.PALETTE["status_ok"] if trust >= 0.85 else (self.PALETTE["status_warn"] if trust >= 0.6 else self.PALETTE["status_error"])
+        elif key == "eligibility":
+            color = self.PALETTE["status_ok"] if value in {"ok", "demo_mode"} else self.PALETTE["status_error"]
+
+        return color
 
     def _refresh_button_states(self) -> None:
         services_on = self._state.node_agent_status in {"ok", "starting"}
@@ -1449,7 +1752,8 @@ class NodeAgentUI(tk.Tk):
                 completed += 1
             elif status == "failed":
                 failed += 1
-        self._tasks_summary_var.set(
+        self._set_var(
+            self._tasks_summary_var,
             f"Assigned: {assigned} | Network Active: {network_active} | Completed: {completed} | Failed: {failed}"
         )
 
@@ -1465,16 +1769,18 @@ class NodeAgentUI(tk.Tk):
         items = sorted(self._distributed_tasks.values(), key=self._task_sort_key, reverse=True)[:120]
         self._distributed_task_order = [str(item.get("job_id") or "") for item in items if item.get("job_id")]
 
-        self._tasks_list.delete(0, tk.END)
+        lines = []
         for item in items:
             status = str(item.get("status") or "unknown").upper()
             mode = str(item.get("mode") or "inference")
             scope = str(item.get("scope") or "network")
             job_id = str(item.get("job_id") or "-")
             progress = float(item.get("progress") or 0.0)
-            line = f"[{status:<9}] {job_id} | {mode} | {scope} | {progress:5.1f}%"
-            self._tasks_list.insert(tk.END, line)
+            lines.append(f"[{status:<9}] {job_id} | {mode} | {scope} | {progress:5.1f}%")
+        self._replace_changed_rows(self._tasks_list, self._tasks_list_lines, lines)
+        self._tasks_list_lines = lines
 
+        self._tasks_list.selection_clear(0, tk.END)
         if selected_job_id and selected_job_id in self._distributed_task_order:
             index = self._distributed_task_order.index(selected_job_id)
             self._tasks_list.selection_set(index)
@@ -1490,6 +1796,22 @@ class NodeAgentUI(tk.Tk):
 
         self._refresh_tasks_summary()
 
+    @staticmethod
+    def _replace_changed_rows(listbox: tk.Listbox, old: list[str], new: list[str]) -> None:
+        # Most updates touch one task (a progress tick) or add one at the top, so only the span
+        # between the unchanged head and tail is deleted and reinserted.
+        limit = min(len(old), len(new))
+        head = 0
+        while head < limit and old[head] == new[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old[-1 - tail] == new[-1 - tail]:
+            tail += 1
+        if len(old) - tail > head:
+            listbox.delete(head, len(old) - tail - 1)
+        if len(new) - tail > head:
+            listbox.insert(head, *new[head:len(new) - tail])
+
     def _write_task_detail(self, job_id: str) -> None:
         if self._tasks_detail is None:
             return
@@ -1559,66 +1881,106 @@ class NodeAgentUI(tk.Tk):
             }
             self._distributed_tasks = {key: value for key, value in self._distributed_tasks.items() if key in keep_ids}
 
-    def _handle_task_update_event(self, payload: dict) -> None:
-        self._upsert_distributed_task(payload)
-        self._render_distributed_tasks()
-
-    def _handle_distributed_tasks_event(self, payload: dict) -> None:
-        for item in payload.get("items", []):
-            if isinstance(item, dict):
-                self._upsert_distributed_task(item)
-        self._render_distributed_tasks()
-
-    def _drain_events(self) -> None:
+    def _render_device_details(self, payload: dict) -> None:
+        if not hasattr(self, "_snapshot_text"):
+            # Hardware tab not built yet; it renders the latest details when first opened.
+            self._pending_device_details = payload
+            return
+        self._snapshot_text.configure(state="normal")
+        self._snapshot_text.delete("1.0", tk.END)
+        self._snapshot_text.insert(tk.END, format_snapshot(payload.get("snapshot") or {}))
+        self._snapshot_text.configure(state="disabled")
+
+        self._debug_text.configure(state="normal")
+        self._debug_text.delete("1.0", tk.END)
+        self._debug_text.insert(tk.END, format_debug_trace(payload.get("debug") or []))
+        self._debug_text.configure(state="disabled")
+
+    def _render_models(self, payload: dict) -> None:
+        if hasattr(self, "_models_list") and hasattr(self, "_model_status"):
+            self._models_list.delete(0, tk.END)
+            for item in payload.get("items", []):
+                self._models_list.insert(tk.END, item)
+            self._model_status.configure(text=f"{len(payload.get('items', []))} models available")
+
+    def _pump_events(self) -> None:
         while True:
+            if not self._events.wait(timeout=0.5):
+                continue
+            # Let the rest of a burst land so it is applied as one batch.
+            time.sleep(self.EVENT_BURST_WINDOW_SEC)
+            self._drain_done.clear()
             try:
-                event = self._events.get_nowait()
-            except queue.Empty:
-                break
+                self.after_idle(self._drain_events)
+            except RuntimeError:
+                # mainloop is not running (yet); Tk cannot take cross-thread calls until it is.
+                time.sleep(0.5)
+                continue
+            except tk.TclError:
+                # The window is gone.
+                return
+            self._drain_done.wait()
+
+    def _poll_events(self) -> None:
+        if len(self._events):
+            self._drain_events()
+        self.after(self.EVENT_POLL_MS, self._poll_events)
 
+    def _drain_events(self) -> None:
+        # Take the whole backlog first, then touch Tk once per widget: console lines go in as one
+        # batch, snapshot-style events only render their latest payload, the task list renders once.
+        try:
+            events = self._events.drain(len(self._events) + 1)
+        finally:
+            self._drain_done.set()
+
+        console_messages: list[str] = []
+        latest_device_details: dict | None = None
+        latest_models: dict | None = None
+        tasks_dirty = False
+        for event in events:
             event_type = event.get("type")
             payload = event.get("payload", {})
 
             if event_type == "console":
-                self._append_console(payload.get("message", ""))
+                console_messages.append(payload.get("message", ""))
             elif event_type == "status":
-                self._append_console(
+                console_messages.append(
                     "status_update "
                     f"coord={payload.get('coordinator')} "
                     f"agent={payload.get('agent')} "
                     f"runtime={payload.get('runtime')}"
                 )
             elif event_type == "device_details":
-                self._snapshot_text.configure(state="normal")
-                self._snapshot_text.delete("1.0", tk.END)
-                self._snapshot_text.insert(tk.END, payload.get("snapshot", ""))
-                self._snapshot_text.configure(state="disabled")
-
-                self._debug_text.configure(state="normal")
-                self._debug_text.delete("1.0", tk.END)
-                self._debug_text.insert(tk.END, payload.get("debug", ""))
-                self._debug_text.configure(state="disabled")
+                latest_device_details = payload
             elif event_type == "models":
-                if hasattr(self, "_models_list") and hasattr(self, "_model_status"):
-                    self._models_list.delete(0, tk.END)
-                    for item in payload.get("items", []):
-                        self._models_list.insert(tk.END, item)
-                    self._model_status.configure(text=f"{len(payload.get('items', []))} models available")
+                latest_models = payload
             elif event_type == "model_downloaded":
                 if hasattr(self, "_model_status"):
                     self._model_status.configure(text=f"Downloaded: {payload.get('model')}")
-                self._append_console(f"model_downloaded name={payload.get('model')}")
+                console_messages.append(f"model_downloaded name={payload.get('model')}")
                 self._controller.request_models()
             elif event_type == "model_download_failed":
                 if hasattr(self, "_model_status"):
                     self._model_status.configure(text=f"Download failed: {payload.get('error')}")
-                self._append_console(f"model_download_failed error={payload.get('error')}")
+                console_messages.append(f"model_download_failed error={payload.get('error')}")
             elif event_type == "task_update":
-                self._handle_task_update_event(payload)
+                self._upsert_distributed_task(payload)
+                tasks_dirty = True
             elif event_type == "distributed_tasks":
-                self._handle_distributed_tasks_event(payload)
-
-        self.after(250, self._drain_events)
+                for item in payload.get("items", []):
+                    if isinstance(item, dict):
+                        self._upsert_distributed_task(item)
+                tasks_dirty = True
+
+        if console_messages:
+            self._append_console_lines(console_messages)
+        if latest_device_details is not None:
+            self._render_device_details(latest_device_details)
+        if latest_models is not None:
+            self._render_models(latest_models)
+        if tasks_dirty:
+            self._render_distributed_tasks()
 
 
 def run_ui() -> None:
@@ -1,22 +1,127 @@
 from __future__ import annotations
 
-from datetime import datetime
+from collections import deque
+from dataclasses import asdict
 import os
-import queue
+import selectors
 import signal
+import socket
 import sys
+import threading
 import time
 
 from app.agent import AgentController
 from app.config import get_log_dir, load_config, save_config
+from app.event_queue import EventQueue
 from app.logger import setup_logging
 from app.state import AgentState
 
 DEFAULT_COORDINATOR = "http://127.0.0.1:8000"
+EVENT_BATCH_MAX = 256
+SERVICES_READY_TIMEOUT_SEC = 5
+SHUTDOWN_TIMEOUT_SEC = 1
+STATUS_TICK_IDLE_SEC = 8
+STATUS_TICK_REPEAT_SEC = 60
+
+# AgentController.emit interns event types, so the loop can dispatch on identity.
+_CONSOLE = sys.intern("console")
+_STATUS = sys.intern("status")
+_EMPTY: dict = {}
+
+_STATUS_UPDATE_FMT = "status_update coordinator={} agent={} registration={} runtime={} node_id={}\n"
+_STATUS_TICK_FMT = "status_tick coord={} registration={} runtime={} node_id={}\n"
+
+WRITER_MAX_BYTES = 64 * 1024
+WRITER_LINGER_SEC = 0.02
+WRITER_IOV_MAX = 1024
+
+
+class _StdoutWriter:
+    # Keeps write()/flush syscalls off the event loop: lines are queued and a
+    # background thread writes them in batches (first line + linger window).
+    def __init__(self, fd: int = 1) -> None:
+        self._fd = fd
+        self._lines: deque[str] = deque()
+        self._wakeup = threading.Event()
+        self._closing = False
+        self._thread = threading.Thread(target=self._writer_loop, name="stdout-writer", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def write(self, text: str) -> None:
+        self._lines.append(text)
+        self._wakeup.set()
+
+    def close(self, timeout: float = 1.0) -> None:
+        self._closing = True
+        self._wakeup.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._flush()
+
+    def _writer_loop(self) -> None:
+        while not self._closing:
+            self._wakeup.wait()
+            if not self._closing:
+                time.sleep(WRITER_LINGER_SEC)
+            self._wakeup.clear()
+            self._flush()
+
+    def _flush(self) -> None:
+        parts: list[str] = []
+        popleft = self._lines.popleft
+        while True:
+            try:
+                parts.append(popleft())
+            except IndexError:
+                break
+        if not parts:
+            return
+
+        buffers = [part.encode("utf-8", errors="replace") for part in parts]
+        try:
+            if hasattr(os, "writev"):
+                self._writev_all(buffers)
+            else:
+                self._write_all(b"".join(buffers))
+        except OSError:
+            return
+
+    def _writev_all(self, buffers: list[bytes]) -> None:
+        # One gathered syscall per IOV_MAX lines; partial writes resume mid-buffer.
+        start = 0
+        while start < len(buffers):
+            written = os.writev(self._fd, buffers[start : start + WRITER_IOV_MAX])
+            while start < len(buffers) and written >= len(buffers[start]):
+                written -= len(buffers[start])
+                start += 1
+            if written:
+                buffers[start] = buffers[start][written:]
+
+    def _write_all(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view[:WRITER_MAX_BYTES])
+            view = view[written:]
+
+
+def _fast_utc_isoformat(ns: int) -> str:
+    # Same shape as datetime.utcnow().isoformat(), without building a datetime.
+    secs, rem = divmod(ns, 1_000_000_000)
+    tm = time.gmtime(secs)
+    stamp = (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+    )
+    micros = rem // 1000
+    # isoformat() leaves out the fraction entirely when it is zero.
+    return f"{stamp}.{micros:06d}" if micros else stamp
 
 
 def main() -> int:
     cfg = load_config()
+    loaded = asdict(cfg)
     cfg.coordinator_url = (os.getenv("COORDINATOR_URL") or cfg.coordinator_url or DEFAULT_COORDINATOR).strip()
     if not cfg.node_join_token:
         cfg.node_join_token = "dev-node-join-token"
@@ -24,74 +129,117 @@ def main() -> int:
     if not cfg.consent_accepted:
         cfg.consent_accepted = True
         cfg.consent_name = "AutoRunner"
-        cfg.consent_at = datetime.utcnow().isoformat()
+        cfg.consent_at = _fast_utc_isoformat(time.time_ns())
 
     # Keep runtime eligible on systems without dedicated GPU.
     cfg.demo_mode = True
 
-    save_config(cfg)
+    # Restarts usually find the config already migrated; avoid rewriting an identical file.
+    if asdict(cfg) != loaded:
+        save_config(cfg)
+
+    writer = _StdoutWriter()
+    writer.start()
+
+    # Queue notifications and signal wakeups share one socket so the loop has a single wait point.
+    wake_r, wake_w = socket.socketpair()
+    wake_r.setblocking(False)
+    wake_w.setblocking(False)
+    selector = selectors.DefaultSelector()
+    selector.register(wake_r, selectors.EVENT_READ)
 
-    events: queue.Queue = queue.Queue()
+    events = EventQueue(wakeup_sock=wake_w)
     state = AgentState()
     logger = setup_logging(get_log_dir(), "INFO")
     controller = AgentController(cfg, state, events, logger)
 
-    controller.start_services()
-    time.sleep(2)
-    controller.register_node()
-    time.sleep(2)
-    controller.start_runtime()
-
-    print(f"node_agent_started coordinator_url={cfg.coordinator_url} demo_mode={cfg.demo_mode}", flush=True)
-
     def _shutdown(*_args) -> None:
-        print("node_agent_stopping", flush=True)
+        writer.write("node_agent_stopping\n")
         try:
-            controller.stop_runtime()
-            controller.stop_services()
-            time.sleep(1)
+            # A signal can land mid-startup; only tear down what was actually started.
+            if controller.services_started:
+                controller.stop_runtime()
+                controller.stop_services()
+                controller.runtime_stopped.wait(timeout=SHUTDOWN_TIMEOUT_SEC)
         finally:
+            writer.close()
             sys.exit(0)
 
     signal.signal(signal.SIGINT, _shutdown)
     if hasattr(signal, "SIGTERM"):
         signal.signal(signal.SIGTERM, _shutdown)
+    signal.set_wakeup_fd(wake_w.fileno(), warn_on_full_buffer=False)
+
+    controller.start_services()
+    controller.services_ready.wait(timeout=SERVICES_READY_TIMEOUT_SEC)
+    controller.register_node()
+    # start_runtime parks in awaiting-registration until the registration above lands.
+    controller.start_runtime()
+
+    writer.write(f"node_agent_started coordinator_url={cfg.coordinator_url} demo_mode={cfg.demo_mode}\n")
+
+    # Idle ticks only print when the status changed, plus a periodic repeat as a liveness signal.
+    last_tick_key: tuple = ()
+    last_tick_t = time.monotonic()
+
+    # Bound once: these are hit on every wakeup.
+    select = selector.select
+    recv = wake_r.recv
+    drain = events.drain
+    write = writer.write
+    start_runtime = controller.start_runtime
+    monotonic = time.monotonic
+    status_fmt = _STATUS_UPDATE_FMT.format
+    console, status, empty = _CONSOLE, _STATUS, _EMPTY
 
     while True:
-        try:
-            event = events.get(timeout=8)
-        except queue.Empty:
+        if not events and not select(timeout=STATUS_TICK_IDLE_SEC):
             if state.registered and state.runtime_status != "running":
-                controller.start_runtime()
-            print(
-                "status_tick "
-                f"coord={state.coordinator_status} "
-                f"registration={state.registration_status} "
-                f"runtime={state.runtime_status} "
-                f"node_id={state.node_id or '-'}",
-                flush=True,
-            )
+                start_runtime()
+            key = (state.coordinator_status, state.registration_status, state.runtime_status, state.node_id or "-")
+            now = monotonic()
+            if key != last_tick_key or now - last_tick_t > STATUS_TICK_REPEAT_SEC:
+                write(_STATUS_TICK_FMT.format(*key))
+                last_tick_key = key
+                last_tick_t = now
             continue
 
-        etype = event.get("type", "")
-        payload = event.get("payload", {}) or {}
-
-        if etype == "console":
-            msg = payload.get("message", "")
-            if msg:
-                print(msg, flush=True)
-        elif etype == "status":
-            print(
-                "status_update "
-                f"coordinator={payload.get('coordinator','')} "
-                f"agent={payload.get('agent','')} "
-                f"registration={payload.get('registration','')} "
-                f"runtime={payload.get('runtime','')} "
-                f"node_id={payload.get('node_id','')}",
-                flush=True,
-            )
-            if state.registered and state.runtime_status != "running":
-                controller.start_runtime()
+        try:
+            recv(4096)
+        except OSError:
+            pass
+
+        # Drain whatever is already queued so bursts cost one writer hand-off.
+        batch = drain(EVENT_BATCH_MAX)
+
+        out: list[str] = []
+        append = out.append
+        saw_status = False
+        for event in batch:
+            etype = event.get("type")
+            payload = event.get("payload") or empty
+
+            if etype is console:
+                msg = payload.get("message", "")
+                if msg:
+                    append(msg)
+                    append("\n")
+            elif etype is status:
+                append(
+                    status_fmt(
+                        payload.get("coordinator", ""),
+                        payload.get("agent", ""),
+                        payload.get("registration", ""),
+                        payload.get("runtime", ""),
+                        payload.get("node_id", ""),
+                    )
+                )
+                saw_status = True
+
+        if out:
+            write("".join(out))
+        if saw_status and state.registered and state.runtime_status != "running":
+            start_runtime()
 
 
 if __name__ == "__main__":
@@ -1,18 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import json
-import os
 import sys
 from typing import Any
 
 def _decode_payload() -> dict[str, Any]:
-    payload_b64 = os.getenv("JOB_PAYLOAD_B64", "").strip()
-    if not payload_b64:
-        raise RuntimeError("missing_JOB_PAYLOAD_B64")
-    raw = base64.urlsafe_b64decode(payload_b64.encode("ascii"))
-    parsed = json.loads(raw.decode("utf-8"))
+    # The agent runs the container with -i and writes the JSON payload to stdin, then closes it.
+    raw = sys.stdin.buffer.read()
+    if not raw.strip():
+        raise RuntimeError("missing_job_payload")
+    parsed = json.loads(raw)
     if not isinstance(parsed, dict):
         raise RuntimeError("invalid_payload_shape")
     return parsed